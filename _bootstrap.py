@@ -0,0 +1,19 @@
+"""
+Script Bootstrap
+
+Shared setup for the helper scripts in the project root. Importing this
+module puts the src directory on the import path (once) and re-exports
+the ConfigManager class the scripts work with.
+"""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from config_manager import ConfigManager
+
+__all__ = ['SRC_DIR', 'ConfigManager']
\ No newline at end of file
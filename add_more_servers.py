@@ -6,72 +6,68 @@ Add Additional Verified SFTP Test Servers
 import sys
 import os
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from _bootstrap import ConfigManager
+
+_USER = os.getenv('USER', 'testuser')
+_DEFAULT_KEY = os.path.expanduser("~/.ssh/id_rsa")
+
+# Additional verified servers
+_ADDITIONAL_SERVERS = [
+    {
+        "name": "Rebex FTPS Test (SFTP mode)",
+        "host": "test.rebex.net", 
+        "port": 22,
+        "username": "demo",
+        "password": "password",
+        "private_key_path": "",
+        "description": "Same as main Rebex but configured separately\nReliable test server with read access"
+    },
+    {
+        "name": "Local SSH Server (if available)",
+        "host": "127.0.0.1",
+        "port": 22,
+        "username": _USER,
+        "password": "",
+        "private_key_path": _DEFAULT_KEY,
+        "description": f"Local SSH server using current user: {_USER}\nRequires SSH server running locally\nUses SSH key authentication"
+    },
+    {
+        "name": "Rebex with Key Auth (demo)",
+        "host": "test.rebex.net",
+        "port": 22, 
+        "username": "demo",
+        "password": "",
+        "private_key_path": "",
+        "description": "Rebex test server - key auth attempt\nMay not work but worth testing"
+    }
+]
 
-from config_manager import ConfigManager
 
 def add_more_servers():
     """Add more verified SFTP test servers."""
     config = ConfigManager()
     
-    # Additional verified servers
-    additional_servers = [
-        {
-            "name": "Rebex FTPS Test (SFTP mode)",
-            "host": "test.rebex.net", 
-            "port": 22,
-            "username": "demo",
-            "password": "password",
-            "private_key_path": "",
-            "description": "Same as main Rebex but configured separately\nReliable test server with read access"
-        },
-        {
-            "name": "Local SSH Server (if available)",
-            "host": "127.0.0.1",
-            "port": 22,
-            "username": os.getenv('USER', 'testuser'),
-            "password": "",
-            "private_key_path": os.path.expanduser("~/.ssh/id_rsa"),
-            "description": f"Local SSH server using current user: {os.getenv('USER', 'testuser')}\nRequires SSH server running locally\nUses SSH key authentication"
-        },
-        {
-            "name": "Rebex with Key Auth (demo)",
-            "host": "test.rebex.net",
-            "port": 22, 
-            "username": "demo",
-            "password": "",
-            "private_key_path": "",
-            "description": "Rebex test server - key auth attempt\nMay not work but worth testing"
-        }
-    ]
+    # Skip servers that already exist
+    new_servers = []
+    for conn in _ADDITIONAL_SERVERS:
+        if config.get_connection(conn['name']):
+            print(f"⚠️  '{conn['name']}' already exists, skipping")
+        else:
+            new_servers.append(conn)
     
     added_count = 0
-    for conn in additional_servers:
-        try:
-            # Check if already exists
-            if config.get_connection(conn['name']):
-                print(f"⚠️  '{conn['name']}' already exists, skipping")
-                continue
-                
-            success = config.save_connection(
-                name=conn['name'],
-                host=conn['host'],
-                port=conn['port'],
-                username=conn['username'],
-                password=conn['password'] if conn['password'] else None,
-                private_key_path=conn['private_key_path'] if conn['private_key_path'] else None,
-                description=conn['description']
-            )
-            
+    try:
+        results = config.save_connections(new_servers)
+        
+        for conn, success in zip(new_servers, results):
             if success:
                 print(f"✅ Added: {conn['name']}")
                 added_count += 1
             else:
                 print(f"❌ Failed to save: {conn['name']}")
                 
-        except Exception as e:
-            print(f"❌ Error adding '{conn['name']}': {e}")
+    except Exception as e:
+        print(f"❌ Error adding servers: {e}")
     
     return added_count
 
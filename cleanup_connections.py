@@ -8,10 +8,7 @@ This script removes non-working test servers and keeps only the verified working
 import sys
 import os
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from config_manager import ConfigManager
+from _bootstrap import ConfigManager
 
 def clean_connections():
     """Remove non-working connections and keep only verified working ones."""
@@ -43,21 +40,23 @@ def clean_connections():
     print(f"\nRemoving {len(remove_connections)} non-working connections...")
     print("=" * 50)
     
+    to_remove = [name for name in connections if name in remove_connections]
+    
     removed_count = 0
-    for name in list(connections.keys()):
-        if name in remove_connections:
-            try:
-                success = config.delete_connection(name)
-                if success:
-                    print(f"🗑️  Removed: {name}")
-                    removed_count += 1
-                else:
-                    print(f"❌ Failed to remove: {name}")
-            except Exception as e:
-                print(f"❌ Error removing '{name}': {e}")
-        elif name in keep_connections:
-            print(f"✅ Kept: {name}")
+    try:
+        removed_count = config.delete_connections(to_remove)
+        if removed_count == len(to_remove):
+            for name in to_remove:
+                print(f"🗑️  Removed: {name}")
         else:
+            print(f"❌ Failed to remove {len(to_remove) - removed_count} connection(s)")
+    except Exception as e:
+        print(f"❌ Error removing connections: {e}")
+    
+    for name in connections:
+        if name in keep_connections:
+            print(f"✅ Kept: {name}")
+        elif name not in remove_connections:
             # Unknown connection - ask what to do
             print(f"❓ Unknown connection: {name} (keeping)")
     
@@ -66,16 +65,18 @@ def clean_connections():
 def add_one_more_working_server():
     """Add one more potentially working server for variety."""
     config = ConfigManager()
+    user = os.getenv('USER', 'user')
+    default_key = os.path.expanduser("~/.ssh/id_rsa")
     
     # Add a localhost option for users who might have SSH running
     localhost_conn = {
         "name": "Localhost SSH (Optional)",
         "host": "localhost",
         "port": 22,
-        "username": os.getenv('USER', 'user'),
+        "username": user,
         "password": "",
-        "private_key_path": os.path.expanduser("~/.ssh/id_rsa"),
-        "description": f"Local SSH server for testing\nUser: {os.getenv('USER', 'user')}\nRequires SSH server running\nUses SSH key (~/.ssh/id_rsa)"
+        "private_key_path": default_key,
+        "description": f"Local SSH server for testing\nUser: {user}\nRequires SSH server running\nUses SSH key (~/.ssh/id_rsa)"
     }
     
     try:
@@ -15,7 +15,7 @@ src_dir = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_dir))
 
 try:
-    from src.main_app import main
+    from main_app import main
     
     if __name__ == "__main__":
         main()
@@ -3,17 +3,12 @@
 Remove Non-Working Localhost Connection
 """
 
-import sys
-import os
+from _bootstrap import ConfigManager
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from config_manager import ConfigManager
-
-def remove_localhost():
+def remove_localhost(config=None):
     """Remove the non-working localhost connection."""
-    config = ConfigManager()
+    if config is None:
+        config = ConfigManager()
     
     connection_name = "Localhost SSH (Optional)"
     
@@ -32,8 +27,10 @@ def remove_localhost():
 if __name__ == "__main__":
     print("Removing non-working localhost connection...")
     
-    if remove_localhost():
+    config = ConfigManager()
+    if remove_localhost(config):
         print("\n📋 Testing remaining connections...")
-        os.system("python test_connections.py")
+        from test_connections import test_all_connections
+        test_all_connections(config)
     else:
         print("\n❌ Failed to clean up connections")
\ No newline at end of file
@@ -8,8 +8,18 @@ __version__ = "1.0.0"
 __author__ = "SFTP Client Development Team"
 __description__ = "A full-featured SFTP client application"
 
-from .sftp_client import SFTPClient
-from .config_manager import ConfigManager
-from .main_app import SFTPClientApp
+__all__ = ['SFTPClient', 'ConfigManager', 'SFTPClientApp']
 
-__all__ = ['SFTPClient', 'ConfigManager', 'SFTPClientApp']
\ No newline at end of file
+
+def __getattr__(name):
+    """Import the public classes on first access (keeps tkinter/paramiko out of light imports)."""
+    if name == 'ConfigManager':
+        from .config_manager import ConfigManager
+        return ConfigManager
+    if name == 'SFTPClient':
+        from .sftp_client import SFTPClient
+        return SFTPClient
+    if name == 'SFTPClientApp':
+        from .main_app import SFTPClientApp
+        return SFTPClientApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
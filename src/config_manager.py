@@ -6,13 +6,81 @@ including server connections and user preferences.
 """
 
 import os
+import copy
 import json
-import yaml
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Tuple
 from pathlib import Path
-from cryptography.fernet import Fernet
 import base64
+import functools
+import hashlib
+import stat
+import tempfile
+import time
+from types import MappingProxyType
+
+# orjson is optional; the stdlib json module is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional; it lets large import files be merged without parsing them whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Maximum number of decrypted passwords kept in memory per ConfigManager
+DECRYPT_CACHE_SIZE = 128
+
+# Import files smaller than this are parsed in one go even when ijson is available
+STREAMING_IMPORT_THRESHOLD = 1024 * 1024
+
+# Process umask, read once so new config files get the usual default permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_codec() -> tuple:
+    """
+    Import PyYAML on first use.
+    
+    Returns:
+        Tuple of (yaml module, loader, dumper), preferring the LibYAML-backed
+        CSafeLoader/CSafeDumper when PyYAML was built with them
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key_path(key_path: str) -> tuple:
+    """Split a dotted setting path into its keys, caching the result."""
+    return tuple(key_path.split('.'))
+
+
+def _thaw(mapping) -> Dict[str, Any]:
+    """Copy a (possibly read-only) nested mapping into plain, mutable dicts."""
+    return {key: _thaw(value) if isinstance(value, (dict, MappingProxyType)) else value
+            for key, value in mapping.items()}
+
+
+def _leaf_paths(settings: Dict[str, Any]) -> Iterable[tuple]:
+    """Yield the key path of every non-dict value in a nested settings dict."""
+    stack = [((), settings)]
+    while stack:
+        prefix, section = stack.pop()
+        for key, value in section.items():
+            if isinstance(value, dict):
+                stack.append((prefix + (key,), value))
+            else:
+                yield prefix + (key,)
 
 
 class ConfigManager:
@@ -21,12 +89,49 @@ class ConfigManager:
     and user preferences with encryption support for sensitive data.
     """
     
-    def __init__(self, config_dir: str = None):
+    # Default settings, shared read-only by all instances; see default_settings
+    _DEFAULT_SETTINGS = MappingProxyType({
+        "appearance": MappingProxyType({
+            "theme": "light",
+            "font_size": 12,
+            "font_family": "Arial"
+        }),
+        "transfer": MappingProxyType({
+            "default_local_path": os.path.expanduser("~"),
+            "confirm_overwrites": True,
+            "preserve_timestamps": True,
+            "create_missing_directories": True,
+            "confirm_local_to_remote": True,
+            "confirm_remote_to_local": True
+        }),
+        "connection": MappingProxyType({
+            "timeout": 30,
+            "keep_alive_interval": 60,
+            "auto_reconnect": True,
+            "socket_buffer_mb": 0,
+            "backend": "paramiko"
+        }),
+        "logging": MappingProxyType({
+            "level": "INFO",
+            "max_log_files": 10,
+            "max_log_size_mb": 10
+        }),
+        "window": MappingProxyType({
+            "width": 1200,
+            "height": 800,
+            "maximized": False,
+            "remember_size": True
+        })
+    })
+    _DEFAULT_PATHS = frozenset(_leaf_paths(_thaw(_DEFAULT_SETTINGS)))
+    
+    def __init__(self, config_dir: str = None, memoize: bool = True):
         """
         Initialize the configuration manager.
         
         Args:
             config_dir: Directory for configuration files
+            memoize: Reuse parsed files until their mtime or size changes
         """
         if config_dir is None:
             # Default to config directory relative to application
@@ -40,82 +145,108 @@ class ConfigManager:
         self.settings_file = self.config_dir / "settings.yaml"
         self.key_file = self.config_dir / ".key"
         
+        # String forms of the paths above for the os-level I/O helpers
+        self._connections_path = os.fspath(self.connections_file)
+        self._settings_path = os.fspath(self.settings_file)
+        self._key_path = os.fspath(self.key_file)
+        
         self.logger = logging.getLogger(__name__)
         
-        # Initialize encryption key
+        # Parsed files, reused while their mtime and size are unchanged
+        self.memoize = memoize
+        self._connections_cache = None
+        self._connections_stamp = None
+        self._settings_cache = None
+        self._settings_stamp = None
+        
+        # Digest and stamp of what was last written to each config file
+        self._written_digests = {}
+        
+        # Encryption key and cipher are loaded on first use (see _fernet)
         self._encryption_key = None
-        self._load_or_create_key()
-        
-        # Default settings
-        self.default_settings = {
-            "appearance": {
-                "theme": "light",
-                "font_size": 12,
-                "font_family": "Arial"
-            },
-            "transfer": {
-                "default_local_path": os.path.expanduser("~"),
-                "confirm_overwrites": True,
-                "preserve_timestamps": True,
-                "create_missing_directories": True,
-                "confirm_local_to_remote": True,
-                "confirm_remote_to_local": True
-            },
-            "connection": {
-                "timeout": 30,
-                "keep_alive_interval": 60,
-                "auto_reconnect": True
-            },
-            "logging": {
-                "level": "INFO",
-                "max_log_files": 10,
-                "max_log_size_mb": 10
-            },
-            "window": {
-                "width": 1200,
-                "height": 800,
-                "maximized": False,
-                "remember_size": True
-            }
-        }
+        self._cipher = None
+        self._decrypted = {}  # token -> password, only valid for the current key
+    
+    @property
+    def default_settings(self) -> Dict[str, Any]:
+        """A fresh, mutable copy of the default settings."""
+        return _thaw(self._DEFAULT_SETTINGS)
+    
+    @property
+    def _fernet(self):
+        """Fernet cipher for stored passwords, created on first access."""
+        if self._encryption_key is None:
+            self._load_or_create_key()
+        return self._cipher
     
     def _load_or_create_key(self):
         """Load existing encryption key or create a new one."""
+        # Imported here so settings-only use never loads the crypto backend
+        from cryptography.fernet import Fernet
+        
         try:
-            if self.key_file.exists():
-                with open(self.key_file, 'rb') as f:
-                    self._encryption_key = f.read()
-            else:
+            try:
+                self._encryption_key = self._slurp(self._key_path)[0]
+            except FileNotFoundError:
                 # Create new key
                 self._encryption_key = Fernet.generate_key()
-                with open(self.key_file, 'wb') as f:
-                    f.write(self._encryption_key)
-                # Make key file readable only by owner
-                os.chmod(self.key_file, 0o600)
+                # Created readable only by owner, so there is no window before a chmod
+                self._atomic_write_bytes(self._key_path, self._encryption_key, private=True)
         except Exception as e:
-            self.logger.error(f"Failed to load/create encryption key: {e}")
+            self.logger.error("Failed to load/create encryption key: %s", e)
             # Fallback to a default key (not secure, but allows operation)
             self._encryption_key = base64.urlsafe_b64encode(b"default_key_not_secure" + b"0" * 16)[:32]
+        
+        # Build the cipher once; it is reused for every encrypt/decrypt
+        self._decrypted.clear()
+        try:
+            self._cipher = Fernet(self._encryption_key)
+        except Exception as e:
+            self.logger.error("Invalid encryption key: %s", e)
+            self._cipher = None
+    
+    @staticmethod
+    def _is_legacy_token(encrypted_password: str) -> bool:
+        """Check for passwords stored with an extra base64 layer around the Fernet token."""
+        # Fernet tokens are already urlsafe base64 and start with the 0x80 version byte
+        return not encrypted_password.startswith("gAAAA")
     
     def _encrypt_password(self, password: str) -> str:
         """Encrypt a password for storage."""
         try:
-            fernet = Fernet(self._encryption_key)
-            encrypted = fernet.encrypt(password.encode())
-            return base64.urlsafe_b64encode(encrypted).decode()
+            return self._fernet.encrypt(password.encode()).decode('ascii')
         except Exception as e:
-            self.logger.error(f"Failed to encrypt password: {e}")
+            self.logger.error("Failed to encrypt password: %s", e)
             return ""
     
+    def _encrypt_many(self, passwords: List[str]) -> List[str]:
+        """Encrypt a batch of passwords with the shared cipher."""
+        try:
+            encrypt = self._fernet.encrypt
+            return [encrypt(password.encode()).decode('ascii') for password in passwords]
+        except Exception as e:
+            self.logger.error("Failed to encrypt passwords: %s", e)
+            return [self._encrypt_password(password) for password in passwords]
+    
     def _decrypt_password(self, encrypted_password: str) -> str:
         """Decrypt a stored password."""
+        # Tokens are never reused for different passwords, so repeat lookups can skip the cipher
+        password = self._decrypted.get(encrypted_password)
+        if password is not None:
+            return password
+        
         try:
-            fernet = Fernet(self._encryption_key)
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_password.encode())
-            decrypted = fernet.decrypt(encrypted_bytes)
-            return decrypted.decode()
+            token = encrypted_password.encode('ascii')
+            if self._is_legacy_token(encrypted_password):
+                token = base64.urlsafe_b64decode(token)
+            password = self._fernet.decrypt(token).decode()
+            
+            if len(self._decrypted) >= DECRYPT_CACHE_SIZE:
+                self._decrypted.clear()
+            self._decrypted[encrypted_password] = password
+            return password
         except Exception as e:
-            self.logger.error(f"Failed to decrypt password: {e}")
+            self.logger.error("Failed to decrypt password: %s", e)
             return ""
     
     def save_connection(self, name: str, host: str, port: int, username: str,
@@ -136,33 +267,243 @@ class ConfigManager:
         Returns:
             bool: True if successful
         """
-        try:
-            connections = self.load_connections()
-            
-            connection_data = {
-                "host": host,
-                "port": port,
-                "username": username,
-                "description": description or "",
-                "created": str(Path().resolve()),  # Current timestamp as string
-                "private_key_path": private_key_path or ""
-            }
+        return self.save_connections([{
+            "name": name,
+            "host": host,
+            "port": port,
+            "username": username,
+            "password": password,
+            "private_key_path": private_key_path,
+            "description": description
+        }])[0]
+    
+    def save_connections(self, connections: Iterable[Dict[str, Any]]) -> List[bool]:
+        """
+        Save several connection profiles with a single write.
+        
+        Args:
+            connections: Connection dictionaries using the same keys as the
+                save_connection arguments (name, host, port, username and
+                optionally password, private_key_path, description)
             
-            # Encrypt password if provided
-            if password:
-                connection_data["encrypted_password"] = self._encrypt_password(password)
+        Returns:
+            List of booleans, one per connection, True if it was saved
+        """
+        connections = list(connections)
+        results = [False] * len(connections)
+        
+        try:
+            stored = self.load_connections()
+            
+            prepared = []
+            for index, conn in enumerate(connections):
+                try:
+                    # An overwritten profile keeps its original creation time
+                    previous = stored.get(conn["name"]) or {}
+                    connection_data = self._build_connection_data(conn, previous.get("created"))
+                    stored[conn["name"]] = connection_data
+                    prepared.append((connection_data, conn.get("password")))
+                    results[index] = True
+                except Exception as e:
+                    self.logger.error("Failed to prepare connection %s: %s", conn.get('name'), e)
+            
+            # Encrypt all provided passwords in one batch
+            with_password = [(data, password) for data, password in prepared if password]
+            encrypted = self._encrypt_many([password for _, password in with_password])
+            for (connection_data, _), encrypted_password in zip(with_password, encrypted):
+                connection_data["encrypted_password"] = encrypted_password
+            
+            if any(results):
+                self._write_connections(stored)
+            
+            for conn, saved in zip(connections, results):
+                if saved:
+                    self.logger.info("Saved connection profile: %s", conn['name'])
+            return results
             
-            connections[name] = connection_data
+        except Exception as e:
+            self.logger.error("Failed to save connections: %s", e)
+            return [False] * len(connections)
+    
+    def _build_connection_data(self, conn: Dict[str, Any], created: Any = None) -> Dict[str, Any]:
+        """
+        Build the stored representation of a connection profile, minus the password.
+        
+        Args:
+            conn: Connection dictionary as passed to save_connections
+            created: Creation time of the profile being replaced, if any
             
-            with open(self.connections_file, 'w') as f:
-                json.dump(connections, f, indent=2)
+        Returns:
+            Dictionary to store under the profile name
+        """
+        # Profiles saved by older versions hold a path string here, not a time
+        if not isinstance(created, int):
+            created = time.time_ns()
+        
+        connection_data = {
+            "host": conn["host"],
+            "port": conn["port"],
+            "username": conn["username"],
+            "description": conn.get("description") or "",
+            "created": created,  # Creation time in nanoseconds since the epoch
+            "private_key_path": conn.get("private_key_path") or ""
+        }
+        
+        return connection_data
+    
+    @staticmethod
+    def _file_stamp(path: str) -> Optional[tuple]:
+        """Return the (mtime_ns, size) of a file, or None if it does not exist."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    @staticmethod
+    def _slurp(path) -> Tuple[bytes, tuple]:
+        """
+        Read a whole file with unbuffered os-level reads.
+        
+        Returns:
+            Tuple of (contents, (mtime_ns, size)) with the stamp taken from
+            the same open file descriptor that was read
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+        try:
+            st = os.fstat(fd)
+            data = os.read(fd, st.st_size)
+            if len(data) < st.st_size:
+                # Short read; keep going until EOF
+                chunks = [data]
+                while True:
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                data = b''.join(chunks)
+            return data, (st.st_mtime_ns, st.st_size)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _parse_json(data: bytes) -> Any:
+        """Parse JSON bytes, using orjson when it is installed."""
+        return orjson.loads(data) if orjson else json.loads(data)
+    
+    @classmethod
+    def _read_json(cls, path) -> Any:
+        """Parse a JSON file."""
+        return cls._parse_json(cls._slurp(path)[0])
+    
+    @staticmethod
+    def _encode_json(data: Any, pretty: bool = False) -> bytes:
+        """
+        Serialize data as JSON, using orjson when it is installed.
+        
+        Args:
+            data: Data to serialize
+            pretty: Indent the output for files meant to be read by people
             
-            self.logger.info(f"Saved connection profile: {name}")
-            return True
+        Returns:
+            Encoded JSON, compact unless pretty is set
+        """
+        if orjson:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+        if pretty:
+            return json.dumps(data, indent=2).encode()
+        return json.dumps(data, separators=(',', ':')).encode()
+    
+    @classmethod
+    def _write_json(cls, path, data: Any):
+        """Write data as indented JSON."""
+        cls._atomic_write_bytes(path, cls._encode_json(data, pretty=True))
+    
+    def _write_config_file(self, path: str, payload: bytes, private: bool = False) -> bool:
+        """
+        Write a config file unless it already holds exactly this payload.
+        
+        The write is skipped only when the payload matches what this instance
+        last wrote and the file's mtime and size show nobody changed it since.
+        
+        Args:
+            path: Config file path
+            payload: Complete file contents
+            private: Make the file readable by its owner only
             
-        except Exception as e:
-            self.logger.error(f"Failed to save connection: {e}")
+        Returns:
+            bool: True if the file was written
+        """
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        stamp = self._file_stamp(path)
+        if stamp is not None and self._written_digests.get(path) == (digest, stamp):
             return False
+        
+        self._atomic_write_bytes(path, payload, private)
+        self._written_digests[path] = (digest, self._file_stamp(path))
+        return True
+    
+    @staticmethod
+    def _atomic_write_bytes(path, data: bytes, private: bool = False):
+        """
+        Replace a file's contents atomically.
+        
+        The data is written in one go to a uniquely named temporary file next
+        to the target, synced to disk and then renamed over the target, so
+        readers never see a half-written file. A symlinked target is followed,
+        so the file it points at is replaced and the link is kept.
+        
+        Args:
+            path: Destination file path
+            data: Complete file contents
+            private: Make the file readable by its owner only; otherwise an
+                existing file keeps its permissions and a new one gets the
+                umask default
+        """
+        path = os.path.realpath(path)
+        if private:
+            mode = 0o600
+        else:
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+        
+        # mkstemp creates the file readable by its owner only
+        directory, name = os.path.split(path)
+        fd, tmp_path = tempfile.mkstemp(prefix='.' + name + '.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            if mode != 0o600:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _iter_import_items(self, file_path: str):
+        """
+        Yield (name, connection) pairs from an exported connections file.
+        
+        Large files are streamed with ijson when it is installed, so the whole
+        document is never held in memory next to the merged result.
+        """
+        if ijson is not None and os.path.getsize(file_path) >= STREAMING_IMPORT_THRESHOLD:
+            with open(file_path, 'rb') as f:
+                yield from ijson.kvitems(f, '', use_float=True)
+        else:
+            yield from self._read_json(file_path).items()
+    
+    def _write_connections(self, connections: Dict[str, Dict[str, Any]]):
+        """Write all connection profiles to the connections file."""
+        self._connections_stamp = None
+        self._write_config_file(self._connections_path, self._encode_json(connections), private=True)
     
     def load_connections(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -172,14 +513,20 @@ class ConfigManager:
             Dictionary of connection profiles
         """
         try:
-            if not self.connections_file.exists():
+            stamp = self._file_stamp(self._connections_path)
+            if stamp is None:
                 return {}
             
-            with open(self.connections_file, 'r') as f:
-                return json.load(f)
+            if not self.memoize or stamp != self._connections_stamp:
+                data, stamp = self._slurp(self._connections_path)
+                self._connections_cache = self._parse_json(data)
+                self._connections_stamp = stamp
+            
+            # Hand out copies so callers can mutate the result freely
+            return {name: dict(conn) for name, conn in self._connections_cache.items()}
                 
         except Exception as e:
-            self.logger.error(f"Failed to load connections: {e}")
+            self.logger.error("Failed to load connections: %s", e)
             return {}
     
     def get_connection(self, name: str) -> Optional[Dict[str, Any]]:
@@ -201,14 +548,20 @@ class ConfigManager:
             
             # Decrypt password if present
             if "encrypted_password" in connection:
-                password = self._decrypt_password(connection["encrypted_password"])
+                encrypted_password = connection.pop("encrypted_password")
+                password = self._decrypt_password(encrypted_password)
                 connection["password"] = password
-                del connection["encrypted_password"]
+                
+                # Rewrite legacy double-encoded passwords in the current format
+                if password and self._is_legacy_token(encrypted_password):
+                    connections[name]["encrypted_password"] = self._encrypt_password(password)
+                    self._write_connections(connections)
+                    self.logger.info("Migrated stored password for connection: %s", name)
             
             return connection
             
         except Exception as e:
-            self.logger.error(f"Failed to get connection: {e}")
+            self.logger.error("Failed to get connection: %s", e)
             return None
     
     def delete_connection(self, name: str) -> bool:
@@ -221,21 +574,48 @@ class ConfigManager:
         Returns:
             bool: True if successful
         """
+        return self.delete_connections([name]) == 1
+    
+    def delete_connections(self, names: Iterable[str]) -> int:
+        """
+        Delete several connection profiles with a single write.
+        
+        Args:
+            names: Connection profile names
+            
+        Returns:
+            int: Number of profiles that were deleted
+        """
         try:
             connections = self.load_connections()
-            if name in connections:
-                del connections[name]
-                
-                with open(self.connections_file, 'w') as f:
-                    json.dump(connections, f, indent=2)
+            deleted = [name for name in set(names) if connections.pop(name, None) is not None]
+            
+            if deleted:
+                self._write_connections(connections)
                 
-                self.logger.info(f"Deleted connection profile: {name}")
-                return True
-            else:
-                return False
+                for name in deleted:
+                    self.logger.info("Deleted connection profile: %s", name)
+            
+            return len(deleted)
                 
         except Exception as e:
-            self.logger.error(f"Failed to delete connection: {e}")
+            self.logger.error("Failed to delete connections: %s", e)
+            return 0
+    
+    def clear(self) -> bool:
+        """
+        Delete all connection profiles.
+        
+        Returns:
+            bool: True if successful
+        """
+        try:
+            self._write_connections({})
+            self.logger.info("Deleted all connection profiles")
+            return True
+        
+        except Exception as e:
+            self.logger.error("Failed to clear connections: %s", e)
             return False
     
     def save_settings(self, settings: Dict[str, Any]) -> bool:
@@ -250,16 +630,19 @@ class ConfigManager:
         """
         try:
             # Merge with defaults to ensure all required settings exist
-            merged_settings = self._merge_settings(self.default_settings, settings)
+            merged_settings = self._merge_settings(self._DEFAULT_SETTINGS, settings)
             
-            with open(self.settings_file, 'w') as f:
-                yaml.dump(merged_settings, f, default_flow_style=False, indent=2)
+            yaml, _, dumper = _yaml_codec()
+            payload = yaml.dump(merged_settings, Dumper=dumper, default_flow_style=False,
+                                indent=2, encoding='utf-8')
+            self._settings_stamp = None
+            self._write_config_file(self._settings_path, payload)
             
             self.logger.info("Saved application settings")
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to save settings: {e}")
+            self.logger.error("Failed to save settings: %s", e)
             return False
     
     def load_settings(self) -> Dict[str, Any]:
@@ -269,26 +652,44 @@ class ConfigManager:
         Returns:
             Settings dictionary
         """
+        return copy.deepcopy(self._current_settings())
+    
+    def _current_settings(self) -> Dict[str, Any]:
+        """Return the shared, cached settings dictionary; callers must not mutate it."""
         try:
-            if not self.settings_file.exists():
+            stamp = self._file_stamp(self._settings_path)
+            if stamp is None:
                 # Return default settings and save them
-                self.save_settings(self.default_settings)
-                return self.default_settings.copy()
-            
-            with open(self.settings_file, 'r') as f:
-                loaded_settings = yaml.safe_load(f)
+                defaults = self.default_settings
+                self.save_settings(defaults)
+                return defaults
+            
+            if not self.memoize or stamp != self._settings_stamp:
+                data, stamp = self._slurp(self._settings_path)
+                yaml, loader, _ = _yaml_codec()
+                loaded_settings = yaml.load(data, Loader=loader)
+                
+                # Merge with defaults to ensure all required settings exist,
+                # unless the file already provides every default key
+                if self._DEFAULT_PATHS.issubset(_leaf_paths(loaded_settings)):
+                    self._settings_cache = loaded_settings
+                else:
+                    self._settings_cache = self._merge_settings(self._DEFAULT_SETTINGS, loaded_settings)
+                self._settings_stamp = stamp
             
-            # Merge with defaults to ensure all required settings exist
-            return self._merge_settings(self.default_settings, loaded_settings)
+            return self._settings_cache
             
         except Exception as e:
-            self.logger.error(f"Failed to load settings: {e}")
-            return self.default_settings.copy()
+            self.logger.error("Failed to load settings: %s", e)
+            return self.default_settings
     
     def _merge_settings(self, default: Dict[str, Any], 
                        loaded: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively merge loaded settings with defaults.
+        Deep-merge loaded settings over defaults.
+        
+        The defaults (which may be read-only mappings) are copied into plain
+        dicts first and the loaded values are then written over them in place.
         
         Args:
             default: Default settings dictionary
@@ -297,13 +698,17 @@ class ConfigManager:
         Returns:
             Merged settings dictionary
         """
-        result = default.copy()
+        result = _thaw(default)
+        stack = [(result, loaded)]
         
-        for key, value in loaded.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_settings(result[key], value)
-            else:
-                result[key] = value
+        while stack:
+            target, overrides = stack.pop()
+            for key, value in overrides.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         
         return result
     
@@ -318,22 +723,17 @@ class ConfigManager:
         Returns:
             Setting value or default
         """
-        try:
-            settings = self.load_settings()
-            keys = key_path.split('.')
-            value = settings
-            
-            for key in keys:
-                if isinstance(value, dict) and key in value:
-                    value = value[key]
-                else:
-                    return default
-            
-            return value
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get setting {key_path}: {e}")
-            return default
+        # _current_settings handles its own errors and the walk below cannot raise
+        value = self._current_settings()
+        
+        for key in _split_key_path(key_path):
+            if isinstance(value, dict) and key in value:
+                value = value[key]
+            else:
+                return default
+        
+        # Only the requested value is copied, not the whole settings tree
+        return copy.deepcopy(value)
     
     def set_setting(self, key_path: str, value) -> bool:
         """
@@ -348,7 +748,7 @@ class ConfigManager:
         """
         try:
             settings = self.load_settings()
-            keys = key_path.split('.')
+            keys = _split_key_path(key_path)
             current = settings
             
             # Navigate to the parent of the target key
@@ -363,7 +763,7 @@ class ConfigManager:
             return self.save_settings(settings)
             
         except Exception as e:
-            self.logger.error(f"Failed to set setting {key_path}: {e}")
+            self.logger.error("Failed to set setting %s: %s", key_path, e)
             return False
     
     def export_connections(self, file_path: str, include_passwords: bool = False) -> bool:
@@ -391,14 +791,13 @@ class ConfigManager:
             else:
                 export_data = connections
             
-            with open(file_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            self._write_json(file_path, export_data)
             
-            self.logger.info(f"Exported connections to {file_path}")
+            self.logger.info("Exported connections to %s", file_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to export connections: {e}")
+            self.logger.error("Failed to export connections: %s", e)
             return False
     
     def import_connections(self, file_path: str, overwrite: bool = False) -> bool:
@@ -413,21 +812,17 @@ class ConfigManager:
             bool: True if successful
         """
         try:
-            with open(file_path, 'r') as f:
-                import_data = json.load(f)
-            
             current_connections = self.load_connections()
             
-            for name, conn_data in import_data.items():
+            for name, conn_data in self._iter_import_items(file_path):
                 if name not in current_connections or overwrite:
                     current_connections[name] = conn_data
             
-            with open(self.connections_file, 'w') as f:
-                json.dump(current_connections, f, indent=2)
+            self._write_connections(current_connections)
             
-            self.logger.info(f"Imported connections from {file_path}")
+            self.logger.info("Imported connections from %s", file_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to import connections: {e}")
+            self.logger.error("Failed to import connections: %s", e)
             return False
\ No newline at end of file
@@ -9,16 +9,39 @@ and drag-and-drop support.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 import threading
+import queue
 import os
+import posixpath
+import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 import logging
 
 from sftp_client import SFTPClient
+from sftp_client_asyncssh import create_sftp_client
 from config_manager import ConfigManager
 from logger import ErrorHandler
 
+# (divisor, suffix) for each size unit shown in the file lists
+_SIZE_UNITS = ((1, "B"), (1024, "KB"), (1024 * 1024, "MB"), (1024 * 1024 * 1024, "GB"))
+
+# Setting that controls the transfer confirmation for each (source, destination) pair
+_CONFIRM_KEYS = {
+    (source, dest): f"transfer.confirm_{source}_to_{dest}"
+    for source in ("local", "remote")
+    for dest in ("local", "remote")
+}
+
+
+def _centered_geometry(window, width: int, height: int) -> str:
+    """Geometry string placing a fixed-size window in the middle of the screen."""
+    # Screen size needs no layout pass, so no update_idletasks() is required
+    x = (window.winfo_screenwidth() // 2) - (width // 2)
+    y = (window.winfo_screenheight() // 2) - (height // 2)
+    return f"{width}x{height}+{x}+{y}"
+
 
 class DragDropConfirmDialog:
     """Dialog to confirm drag-and-drop operations."""
@@ -36,25 +59,19 @@ class DragDropConfirmDialog:
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Confirm File Transfer")
-        self.dialog.geometry("450x200")
+        self.dialog.geometry(_centered_geometry(self.dialog, 450, 200))
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (450 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (200 // 2)
-        self.dialog.geometry(f"450x200+{x}+{y}")
-        
         self.create_widgets()
         
         # Focus on the confirm button
         self.confirm_button.focus_set()
         
         # Bind Enter and Escape keys
-        self.dialog.bind('<Return>', lambda e: self.confirm())
-        self.dialog.bind('<Escape>', lambda e: self.cancel())
+        self.dialog.bind('<Return>', self.confirm)
+        self.dialog.bind('<Escape>', self.cancel)
     
     def create_widgets(self):
         """Create dialog widgets."""
@@ -98,8 +115,7 @@ class DragDropConfirmDialog:
             
             scrollbar.config(command=listbox.yview)
             
-            for file in self.source_files:
-                listbox.insert(tk.END, file)
+            listbox.insert(tk.END, *self.source_files)
         
         # Don't prompt checkbox
         checkbox_frame = ttk.Frame(main_frame)
@@ -121,19 +137,19 @@ class DragDropConfirmDialog:
         self.confirm_button = ttk.Button(button_frame, text="Copy", command=self.confirm)
         self.confirm_button.pack(side=tk.RIGHT)
     
-    def confirm(self):
+    def confirm(self, event=None):
         """Confirm the transfer."""
         self.result = True
         self.dont_prompt = self.dont_prompt_var.get()
         
         # Save the preference if requested
         if self.dont_prompt:
-            key = f"transfer.confirm_{self.source_type}_to_{self.dest_type}"
+            key = _CONFIRM_KEYS[self.source_type, self.dest_type]
             self.config_manager.set_setting(key, False)
         
         self.dialog.destroy()
     
-    def cancel(self):
+    def cancel(self, event=None):
         """Cancel the transfer."""
         self.result = False
         self.dialog.destroy()
@@ -150,17 +166,11 @@ class ProgressDialog:
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(title)
-        self.dialog.geometry("400x120")
+        self.dialog.geometry(_centered_geometry(self.dialog, 400, 120))
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (400 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (120 // 2)
-        self.dialog.geometry(f"400x120+{x}+{y}")
-        
         # Progress widgets
         self.progress_label = ttk.Label(self.dialog, text="Preparing transfer...")
         self.progress_label.pack(pady=10)
@@ -179,12 +189,53 @@ class ProgressDialog:
         self.cancel_button.pack(pady=10)
         
         self.cancelled = False
+        
+        # Progress arrives from the transfer thread; the Tk thread drains it
+        # every 100 ms, so widgets are only touched from the main loop
+        self._poll_ms = 100
+        self._updates = queue.Queue()
+        self.dialog.after(self._poll_ms, self._drain_updates)
+        
+        # Only queue an update once this many more bytes have been transferred
+        self._byte_threshold = 1 << 20
+        self._last_reported = 0
+        
+        # The total only changes between files, so its label text is cached
+        self._inv_mb = 1.0 / (1024 * 1024)
+        self._total_mb_for = total_size
+        self._total_mb_str = f"{total_size * self._inv_mb:.1f}"
     
     def update_progress(self, transferred: int, total: int):
-        """Update progress bar and label."""
+        """Queue a progress update; safe to call from any thread."""
+        # A smaller count than last time means a new file has started
+        if 0 <= transferred - self._last_reported < self._byte_threshold and transferred < total:
+            return
         if self.cancelled:
             return
         
+        self._last_reported = transferred
+        self._updates.put_nowait((transferred, total))
+    
+    def _drain_updates(self):
+        """Apply the most recent queued progress update and reschedule."""
+        if self.cancelled or not self.dialog.winfo_exists():
+            return
+        
+        latest = None
+        while True:
+            try:
+                latest = self._updates.get_nowait()
+            except queue.Empty:
+                break
+        
+        # Tk repaints on its next idle pass; never force it with update(),
+        # which re-enters the event loop from inside this callback
+        if latest is not None:
+            self._apply_progress(*latest)
+        self.dialog.after(self._poll_ms, self._drain_updates)
+    
+    def _apply_progress(self, transferred: int, total: int):
+        """Update progress bar and label."""
         self.transferred = transferred
         if total > 0:
             self.total_size = total
@@ -192,10 +243,12 @@ class ProgressDialog:
             self.progress_bar['value'] = progress
             
             # Format sizes
-            transferred_mb = transferred / (1024 * 1024)
-            total_mb = total / (1024 * 1024)
+            if total != self._total_mb_for:
+                self._total_mb_for = total
+                self._total_mb_str = f"{total * self._inv_mb:.1f}"
+            transferred_mb = transferred * self._inv_mb
             self.progress_label.config(
-                text=f"Transferred: {transferred_mb:.1f} MB / {total_mb:.1f} MB ({progress:.1f}%)"
+                text=f"Transferred: {transferred_mb:.1f} MB / {self._total_mb_str} MB ({progress:.1f}%)"
             )
     
     def cancel(self):
@@ -221,19 +274,13 @@ class ConnectionDialog:
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Server Connection" if not connection_data else "Edit Connection")
-        self.dialog.geometry("500x400")
+        self.dialog.geometry(_centered_geometry(self.dialog, 500, 400))
         self.dialog.resizable(True, False)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
         self.create_widgets()
         self.load_data()
-        
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (500 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (400 // 2)
-        self.dialog.geometry(f"500x400+{x}+{y}")
     
     def create_widgets(self):
         """Create dialog widgets."""
@@ -300,11 +347,18 @@ class ConnectionDialog:
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=8, column=0, columnspan=4, pady=20)
         
-        ttk.Button(button_frame, text="Test Connection", 
-                  command=self.test_connection).pack(side=tk.LEFT, padx=(0, 10))
+        self.test_button = ttk.Button(button_frame, text="Test Connection", 
+                                      command=self.test_connection)
+        self.test_button.pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="Save", command=self.save).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.LEFT)
         
+        # Shown while a connection test runs in the background
+        self.test_progress = ttk.Progressbar(main_frame, mode='indeterminate')
+        self.test_progress.grid(row=9, column=0, columnspan=4, sticky=(tk.W, tk.E))
+        self.test_progress.grid_remove()
+        self._test_results = queue.Queue()
+        
         # Configure grid weights
         main_frame.columnconfigure(1, weight=1)
         self.dialog.columnconfigure(0, weight=1)
@@ -353,32 +407,73 @@ class ConnectionDialog:
             self.on_auth_change()
     
     def test_connection(self):
-        """Test the connection settings."""
+        """Test the connection settings in a background thread."""
         try:
             # Validate inputs
             if not self.host_var.get() or not self.username_var.get():
                 messagebox.showerror("Error", "Host and username are required")
                 return
             
-            # Create temporary SFTP client
-            client = SFTPClient()
-            
-            success = client.connect(
-                host=self.host_var.get(),
-                port=int(self.port_var.get()),
-                username=self.username_var.get(),
-                password=self.password_var.get() if self.auth_method.get() == "password" else None,
-                private_key_path=self.key_path_var.get() if self.auth_method.get() == "key" else None
-            )
+            # Read the Tk variables here; the worker thread must not touch them
+            params = {
+                "host": self.host_var.get(),
+                "port": int(self.port_var.get()),
+                "username": self.username_var.get(),
+                "password": self.password_var.get() if self.auth_method.get() == "password" else None,
+                "private_key_path": self.key_path_var.get() if self.auth_method.get() == "key" else None
+            }
             
-            if success:
-                messagebox.showinfo("Success", "Connection test successful!")
-                client.disconnect()
-            else:
-                messagebox.showerror("Error", "Connection test failed")
-                
         except Exception as e:
             messagebox.showerror("Error", f"Connection test failed: {e}")
+            return
+        
+        # Configured like the app's client, so Connect can reuse the session;
+        # settings are read here, not on the worker thread
+        get_setting = self.config_manager.get_setting
+        client = create_sftp_client(get_setting("connection.backend", "paramiko"))
+        client.keepalive_interval = int(get_setting("connection.keep_alive_interval", 60))
+        buffer_mb = get_setting("connection.socket_buffer_mb", 0)
+        client.socket_buffer_size = int(buffer_mb * 1024 * 1024) or None
+        
+        self.test_button.config(state=tk.DISABLED)
+        self.test_progress.grid()
+        self.test_progress.start()
+        
+        threading.Thread(target=self._run_connection_test, args=(client, params), daemon=True).start()
+        self.dialog.after(100, self._poll_connection_test)
+    
+    def _run_connection_test(self, client: SFTPClient, params: Dict[str, Any]):
+        """Connect with a temporary client and queue the outcome (worker thread)."""
+        try:
+            success = client.connect(**params)
+            if success:
+                # Left open briefly so Connect right after the test reuses it
+                client.disconnect(keep_alive=True)
+            self._test_results.put((success, None))
+        except Exception as e:
+            self._test_results.put((False, e))
+    
+    def _poll_connection_test(self):
+        """Report the connection test result once the worker has finished."""
+        if not self.dialog.winfo_exists():
+            return
+        
+        try:
+            success, error = self._test_results.get_nowait()
+        except queue.Empty:
+            self.dialog.after(100, self._poll_connection_test)
+            return
+        
+        self.test_progress.stop()
+        self.test_progress.grid_remove()
+        self.test_button.config(state=tk.NORMAL)
+        
+        if success:
+            messagebox.showinfo("Success", "Connection test successful!")
+        elif error:
+            messagebox.showerror("Error", f"Connection test failed: {error}")
+        else:
+            messagebox.showerror("Error", "Connection test failed")
     
     def save(self):
         """Save the connection."""
@@ -413,15 +508,28 @@ class ConnectionDialog:
 class FileListFrame(ttk.Frame):
     """Frame containing file list with operations and drag-and-drop support."""
     
+    # Listings reused when navigating back into a directory within a few
+    # seconds; local ones also only while the directory mtime is unchanged
+    _LISTING_TTL = 5.0
+    _LISTING_CACHE_SIZE = 32
+    
+    # Rows inserted per event-loop turn when filling the tree
+    _INSERT_BATCH = 1000
+    
+    # How often results of background jobs are collected, in milliseconds
+    _POLL_MS = 50
+    
     def __init__(self, parent, title: str, is_remote: bool = False):
         super().__init__(parent)
         self.title = title
         self.is_remote = is_remote
         self.current_path = "/" if is_remote else os.getcwd()
+        self._path_prefix = self.current_path.rstrip("/")  # see join_path
         self.sftp_client = None
         self.logger = logging.getLogger(__name__)
         self.config_manager = None
         self.transfer_callback = None
+        self.job_runner = None
         
         # Drag and drop state (keeping for future use)
         self.drag_data = {"items": [], "start_x": 0, "start_y": 0}
@@ -431,6 +539,36 @@ class FileListFrame(ttk.Frame):
         # Clipboard for copy/cut operations
         self.clipboard = {"files": [], "operation": None, "source_frame": None}
         
+        # Incremented per refresh so results of superseded listings are dropped
+        self._refresh_token = 0
+        
+        # Worker threads queue (callback, args) here, or None when a job ends;
+        # the Tk thread drains the queue while any job is running
+        self._results = queue.Queue()
+        self._jobs_running = 0
+        
+        # file_info of every row keyed by tree item id, so lookups skip Tcl
+        self._row_data = {}
+        
+        # path -> (stamp, files); the stamp is (monotonic fetch time, the
+        # directory's st_mtime_ns), the mtime being None for remote listings
+        self._listing_cache = OrderedDict()
+        
+        # Pending debounced path-entry change (an after() id)
+        self._pending_path_change = None
+        
+        # Drop-zone highlight to apply and its pending after() id
+        self._drag_highlight = False
+        self._pending_drag_highlight = None
+        
+        # Latest drag motion (x, y) and the after() id that will process it
+        self._drag_motion = None
+        self._pending_drag_motion = None
+        
+        # Context menu, built on first use and reused afterwards
+        self._context_menu = None
+        self._context_entries = {}
+        
         self.create_widgets()
         self.refresh_list()
     
@@ -442,6 +580,10 @@ class FileListFrame(ttk.Frame):
         """Set the callback function for file transfers."""
         self.transfer_callback = callback
     
+    def set_job_runner(self, runner):
+        """Set the callable(fn, *args) that runs file operations off the Tk thread."""
+        self.job_runner = runner
+    
     def set_drop_target(self, target_frame):
         """Set the target frame for drag-and-drop operations."""
         self.drop_target = target_frame
@@ -504,6 +646,9 @@ class FileListFrame(ttk.Frame):
         list_frame.columnconfigure(0, weight=1)
         list_frame.rowconfigure(0, weight=1)
         
+        # Row styles
+        self.file_tree.tag_configure("directory", foreground="blue")
+        
         # Bind events
         self.file_tree.bind("<Double-1>", self.on_double_click)
         self.file_tree.bind("<Button-3>", self.on_right_click)  # Right-click context menu
@@ -532,94 +677,264 @@ class FileListFrame(ttk.Frame):
     def set_sftp_client(self, client: SFTPClient):
         """Set the SFTP client for remote operations."""
         self.sftp_client = client
+        self._listing_cache.clear()
         if self.is_remote and client and client.is_connected:
-            self.current_path = client.current_remote_path
-            self.path_var.set(self.current_path)
+            self._set_current_path(client.current_remote_path)
             self.refresh_list()
     
-    def refresh_list(self):
-        """Refresh the file list."""
+    def refresh_list(self, use_cache: bool = False, previous_path: str = None):
+        """Refresh the file list, listing the directory in a background thread.
+        
+        Args:
+            use_cache: Reuse a listing fetched within the last few seconds,
+                unless a local directory has visibly changed since
+            previous_path: Directory to go back to if the listing fails
+        """
+        self._refresh_token += 1
+        token = self._refresh_token
+        
+        if self.is_remote and (not self.sftp_client or not self.sftp_client.is_connected):
+            self._clear_tree()
+            return
+        
+        if use_cache:
+            cached = self._listing_cache.get(self.current_path)
+            if cached and self._listing_is_fresh(self.current_path, cached[0]):
+                self._apply_refresh(token, cached[1])
+                return
+        
+        self.file_tree.configure(cursor="watch")
+        self._start_job(self._list_directory, token, self.current_path, previous_path)
+    
+    def _start_job(self, target, *args, runner=None):
+        """Run target(*args) off the Tk thread and collect what it posts.
+        
+        Args:
+            target: Job to run on a worker thread
+            *args: Arguments for target
+            runner: Optional callable(fn, *args) that runs the job; without
+                one it gets a thread of its own
+        """
+        self._jobs_running += 1
+        if self._jobs_running == 1:
+            self.after(self._POLL_MS, self._drain_results)
+        if runner is not None:
+            runner(self._run_job, target, *args)
+        else:
+            threading.Thread(target=self._run_job, args=(target,) + args, daemon=True).start()
+    
+    def _run_job(self, target, *args):
+        """Run a background job, then mark it finished (worker thread)."""
+        try:
+            target(*args)
+        finally:
+            self._results.put(None)
+    
+    def _post(self, callback, *args):
+        """Queue callback(*args) to run on the Tk thread (worker thread)."""
+        self._results.put((callback, args))
+    
+    def _drain_results(self):
+        """Run the callbacks posted by worker threads, polling while jobs remain."""
+        try:
+            while True:
+                try:
+                    item = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._jobs_running -= 1
+                else:
+                    callback, args = item
+                    callback(*args)
+        finally:
+            if self._jobs_running:
+                self.after(self._POLL_MS, self._drain_results)
+    
+    def _list_directory(self, token: int, path: str, previous_path: Optional[str]):
+        """List a directory and post the result to the Tk thread (worker thread)."""
         try:
-            # Clear existing items
-            for item in self.file_tree.get_children():
-                self.file_tree.delete(item)
-            
             if self.is_remote:
-                if not self.sftp_client or not self.sftp_client.is_connected:
-                    return
-                files = self.sftp_client.list_remote_directory(self.current_path)
+                stamp = (time.monotonic(), None)
+                files = self.sftp_client.list_remote_directory(path)
             else:
-                from sftp_client import SFTPClient
-                temp_client = SFTPClient()
-                temp_client.current_local_path = self.current_path
-                files = temp_client.list_local_directory(self.current_path)
+                # Stamp before scanning so a change made mid-scan invalidates it
+                stamp = (time.monotonic(), os.stat(path).st_mtime_ns)
+                files = SFTPClient.scan_local_directory(path)
+        except Exception as e:
+            self._post(self._refresh_failed, token, e, previous_path)
+            return
+        
+        self._post(self._cache_listing, path, stamp, files)
+        self._post(self._apply_refresh, token, files)
+    
+    def _listing_is_fresh(self, path: str, stamp: tuple) -> bool:
+        """Tell whether a cached listing of path can still be shown."""
+        fetched, mtime_ns = stamp
+        # The directory mtime misses files edited in place, so local
+        # listings expire like remote ones
+        if time.monotonic() - fetched >= self._LISTING_TTL:
+            return False
+        if self.is_remote:
+            return True
+        try:
+            return os.stat(path).st_mtime_ns == mtime_ns
+        except OSError:
+            return False
+    
+    def _cache_listing(self, path: str, stamp: tuple, files: List[Dict[str, Any]]):
+        """Remember a listing, evicting the least recently stored one."""
+        cache = self._listing_cache
+        cache[path] = (stamp, files)
+        cache.move_to_end(path)
+        if len(cache) > self._LISTING_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _clear_tree(self):
+        """Remove all rows with a single Tcl call."""
+        children = self.file_tree.get_children()
+        if children:
+            self.file_tree.delete(*children)
+        self._row_data.clear()
+    
+    def _refresh_failed(self, token: int, error: Exception, previous_path: Optional[str] = None):
+        """Report a failed listing unless a newer refresh has started."""
+        if token != self._refresh_token:
+            return
+        
+        self.file_tree.configure(cursor="")
+        # A directory change that could not be listed is undone
+        if previous_path is not None:
+            self._set_current_path(previous_path)
+        self.logger.error(f"Failed to refresh file list: {error}")
+        messagebox.showerror("Error", f"Failed to refresh file list: {error}")
+    
+    def _apply_refresh(self, token: int, files: List[Dict[str, Any]]):
+        """Replace the tree contents with a finished listing."""
+        if token != self._refresh_token:
+            return
+        
+        try:
+            self.file_tree.configure(cursor="")
             
-            # Add files to tree
+            # Format every row before touching the widget
+            format_size = self.format_size
+            rows = []
             for file_info in files:
-                icon = "📁" if file_info["is_directory"] else "📄"
-                size_str = self.format_size(file_info["size"]) if not file_info["is_directory"] else ""
-                modified_str = file_info["modified"].strftime("%Y-%m-%d %H:%M") if file_info["modified"] else ""
-                
-                self.file_tree.insert("", tk.END, 
-                                    text=icon,
-                                    values=(file_info["name"], size_str, modified_str, file_info["permissions"]),
-                                    tags=("directory" if file_info["is_directory"] else "file",))
+                is_directory = file_info["is_directory"]
+                modified = file_info["modified"]
+                rows.append((
+                    file_info,
+                    "📁" if is_directory else "📄",
+                    (file_info["name"],
+                     "" if is_directory else format_size(file_info["size"]),
+                     # Same "%Y-%m-%d %H:%M" text without strftime's locale handling
+                     modified.isoformat(sep=' ', timespec='minutes') if modified else "",
+                     file_info["permissions"]),
+                    ("directory",) if is_directory else ("file",)
+                ))
             
-            # Configure tags
-            self.file_tree.tag_configure("directory", foreground="blue")
+            # Clear existing items in one call, then add the new rows
+            self._clear_tree()
+            self._insert_rows(token, rows, 0)
             
         except Exception as e:
             self.logger.error(f"Failed to refresh file list: {e}")
             messagebox.showerror("Error", f"Failed to refresh file list: {e}")
     
+    def _insert_rows(self, token: int, rows: List[tuple], start: int):
+        """Insert one batch of formatted rows and schedule the next batch.
+        
+        Huge directories are filled over several event-loop turns so the
+        window keeps redrawing and handling input while rows are added.
+        """
+        if token != self._refresh_token:
+            return
+        
+        insert = self.file_tree.insert
+        end = tk.END
+        row_data = self._row_data
+        stop = start + self._INSERT_BATCH
+        for file_info, icon, values, tags in rows[start:stop]:
+            row_data[insert("", end, text=icon, values=values, tags=tags)] = file_info
+        
+        if stop < len(rows):
+            self.after(1, self._insert_rows, token, rows, stop)
+    
     def format_size(self, size: int) -> str:
         """Format file size in human-readable format."""
-        if size < 1024:
+        # Each unit spans 10 bits, so the bit length picks the unit directly
+        index = min((size.bit_length() - 1) // 10, 3) if size > 0 else 0
+        if not index:
             return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        elif size < 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size / (1024 * 1024 * 1024):.1f} GB"
+        divisor, suffix = _SIZE_UNITS[index]
+        return f"{size / divisor:.1f} {suffix}"
     
     def on_path_change(self, event=None):
-        """Handle path change."""
+        """Handle path change, collapsing rapid repeats into one directory change."""
+        if self._pending_path_change is not None:
+            self.after_cancel(self._pending_path_change)
+        self._pending_path_change = self.after(150, self._apply_path_change)
+    
+    def _apply_path_change(self):
+        """Change to the directory typed into the path entry."""
+        self._pending_path_change = None
         new_path = self.path_var.get()
-        if self.change_directory(new_path):
-            self.current_path = new_path
-            self.refresh_list()
-        else:
+        if not self.is_remote:
+            # Relative entries are relative to this panel, not the process cwd
+            new_path = os.path.abspath(os.path.join(self.current_path, os.path.expanduser(new_path)))
+        if not self.change_directory(new_path):
             self.path_var.set(self.current_path)  # Revert to current path
     
     def go_up(self):
         """Go to parent directory."""
         if self.is_remote:
-            parent_path = "/".join(self.current_path.rstrip("/").split("/")[:-1]) or "/"
+            parent_path = self._path_prefix.rpartition("/")[0] or "/"
         else:
             parent_path = str(Path(self.current_path).parent)
         
-        if self.change_directory(parent_path):
-            self.current_path = parent_path
-            self.path_var.set(self.current_path)
-            self.refresh_list()
+        self.change_directory(parent_path)
+    
+    def _set_current_path(self, path: str):
+        """Update the current path, its join prefix and the path entry."""
+        self.current_path = path
+        self._path_prefix = path.rstrip("/")
+        self.path_var.set(path)
+        if self.is_remote and self.sftp_client:
+            self.sftp_client.current_remote_path = path
+    
+    def join_path(self, filename: str) -> str:
+        """Build the full path of an entry in the current directory."""
+        if self.is_remote:
+            # The prefix has no trailing slash, so this also works at "/"
+            return f"{self._path_prefix}/{filename}"
+        return os.path.join(self.current_path, filename)
     
     def change_directory(self, path: str) -> bool:
-        """Change to the specified directory."""
-        try:
-            if self.is_remote:
-                if self.sftp_client and self.sftp_client.is_connected:
-                    return self.sftp_client.change_remote_directory(path)
-                return False
-            else:
-                if os.path.isdir(path):
-                    os.chdir(path)
-                    return True
+        """Change to the specified directory and list it.
+        
+        A remote directory is not checked here, which would block the Tk
+        thread on a round trip; listing it on the worker thread is the check,
+        and the panel goes back to the previous directory if that fails.
+        
+        Args:
+            path: Directory to show, relative to the current one or absolute
+            
+        Returns:
+            bool: False if the directory is known to be unusable right away
+        """
+        if self.is_remote:
+            if not self.sftp_client or not self.sftp_client.is_connected:
                 return False
-        except Exception as e:
-            self.logger.error(f"Failed to change directory: {e}")
-            messagebox.showerror("Error", f"Failed to change directory: {e}")
+            path = posixpath.normpath(posixpath.join(self.current_path, path))
+        elif not os.path.isdir(path):
+            # The panel tracks its own directory; the process cwd is left alone
             return False
+        
+        previous_path = self.current_path
+        self._set_current_path(path)
+        self.refresh_list(use_cache=True, previous_path=previous_path)
+        return True
     
     def on_double_click(self, event):
         """Handle double-click on file/directory."""
@@ -627,25 +942,21 @@ class FileListFrame(ttk.Frame):
         if not selection:
             return
         
-        item = self.file_tree.item(selection[0])
-        filename = item["values"][0]
+        file_info = self._row_data[selection[0]]
+        filename = file_info["name"]
+        is_directory = file_info["is_directory"]
         
-        self.logger.info(f"Double-click on: {filename}, is_directory: {'directory' in self.file_tree.item(selection[0], 'tags')}")
+        self.logger.debug("Double-click on: %s, is_directory: %s", filename, is_directory)
         
         # Check if it's a directory
-        if "directory" in self.file_tree.item(selection[0], "tags"):
-            new_path = os.path.join(self.current_path, filename) if not self.is_remote else f"{self.current_path.rstrip('/')}/{filename}"
-            self.logger.info(f"Attempting to change directory to: {new_path}")
+        if is_directory:
+            new_path = self.join_path(filename)
+            self.logger.debug("Attempting to change directory to: %s", new_path)
             
-            if self.change_directory(new_path):
-                self.current_path = new_path
-                self.path_var.set(self.current_path)
-                self.refresh_list()
-                self.logger.info(f"Successfully changed to directory: {new_path}")
-            else:
+            if not self.change_directory(new_path):
                 self.logger.error(f"Failed to change to directory: {new_path}")
         else:
-            self.logger.info(f"Double-clicked on file: {filename}")
+            self.logger.debug("Double-clicked on file: %s", filename)
     
     def on_right_click(self, event):
         """Handle right-click context menu."""
@@ -656,12 +967,12 @@ class FileListFrame(ttk.Frame):
     
     def get_selected_files(self) -> List[str]:
         """Get list of selected filenames."""
-        selection = self.file_tree.selection()
-        files = []
-        for item in selection:
-            filename = self.file_tree.item(item)["values"][0]
-            files.append(filename)
-        return files
+        row_data = self._row_data
+        return [row_data[item]["name"] for item in self.file_tree.selection()]
+    
+    def get_directory_names(self) -> set:
+        """Get the names of the listed directories."""
+        return {info["name"] for info in self._row_data.values() if info["is_directory"]}
     
     def get_current_path(self) -> str:
         """Get the current directory path."""
@@ -687,22 +998,33 @@ class FileListFrame(ttk.Frame):
             self.drag_data["items"] = list(self.file_tree.selection())
     
     def on_mouse_drag(self, event):
-        """Handle mouse drag event."""
+        """Handle mouse drag event, processing at most one motion per frame."""
         # Don't perform drag operations during double-click
         if self.double_click_pending:
             return
-            
+        
+        self._drag_motion = (event.x, event.y)
+        if self._pending_drag_motion is None:
+            self._pending_drag_motion = self.after(16, self._apply_drag_motion)
+    
+    def _apply_drag_motion(self):
+        """Update drag feedback for the most recent motion event."""
+        self._pending_drag_motion = None
+        if self.double_click_pending or self._drag_motion is None:
+            return
+        x, y = self._drag_motion
+        
         # Check if we've moved far enough to start a drag operation
         if (self.drag_data["items"] and 
-            (abs(event.x - self.drag_data["start_x"]) > 5 or 
-             abs(event.y - self.drag_data["start_y"]) > 5)):
+            (abs(x - self.drag_data["start_x"]) > 5 or 
+             abs(y - self.drag_data["start_y"]) > 5)):
             
             # Change cursor to indicate drag operation
             self.file_tree.config(cursor="hand2")
             
-            # Highlight selected items
+            # Highlight selected items, from the stored name so markers never stack
             for item in self.drag_data["items"]:
-                self.file_tree.set(item, "name", f"▶ {self.file_tree.item(item)['values'][0]}")
+                self.file_tree.set(item, "name", f"▶ {self._row_data[item]['name']}")
     
     def on_mouse_release(self, event):
         """Handle mouse release event for drag end."""
@@ -733,75 +1055,102 @@ class FileListFrame(ttk.Frame):
         """Handle drag enter event."""
         if hasattr(self, 'drop_target') and self.drop_target:
             # Visual feedback when entering drop zone
-            self.configure(relief="solid", borderwidth=2)
+            self._schedule_drag_highlight(True)
     
     def on_drag_leave(self, event):
         """Handle drag leave event."""
         # Remove visual feedback when leaving drop zone
-        self.configure(relief="flat", borderwidth=0)
+        self._schedule_drag_highlight(False)
+    
+    def _schedule_drag_highlight(self, highlighted: bool):
+        """Record the wanted highlight; rapid enter/leave pairs cause one redraw."""
+        self._drag_highlight = highlighted
+        if self._pending_drag_highlight is None:
+            self._pending_drag_highlight = self.after(20, self._apply_drag_highlight)
+    
+    def _apply_drag_highlight(self):
+        """Apply the most recently requested drop-zone highlight."""
+        self._pending_drag_highlight = None
+        if self._drag_highlight:
+            self.configure(relief="solid", borderwidth=2)
+        else:
+            self.configure(relief="flat", borderwidth=0)
     
     def is_widget_in_frame(self, widget, frame):
         """Check if a widget is contained within a frame."""
         try:
-            parent = widget
-            while parent:
-                if parent == frame or parent == frame.file_tree:
-                    return True
-                parent = parent.master
-            return False
+            # Tk path names nest, so containment is a prefix test on ".frame.child"
+            path, frame_path = str(widget), str(frame)
+            return path == frame_path or path.startswith(frame_path + ".")
         except:
             return False
     
-    def show_context_menu(self, event):
-        """Show context menu for file operations."""
+    def _build_context_menu(self) -> tk.Menu:
+        """Create the context menu once, remembering the index of each toggled entry."""
         context_menu = tk.Menu(self, tearoff=0)
-        
-        selection = self.file_tree.selection()
-        if not selection:
-            return
-        
-        # Get selected items info
-        selected_files = self.get_selected_files()
-        is_single_dir = (len(selected_files) == 1 and 
-                        "directory" in self.file_tree.item(selection[0], "tags"))
+        entries = self._context_entries
         
         # File operations
-        if selected_files:
-            context_menu.add_command(label="Copy", command=self.copy_files, accelerator="Ctrl+C")
-            context_menu.add_command(label="Cut", command=self.cut_files, accelerator="Ctrl+X")
-            context_menu.add_separator()
-            
-            # Transfer operations
-            if self.drop_target:
-                if self.is_remote:
-                    context_menu.add_command(label="Download to Local", command=self.download_selected)
-                else:
-                    context_menu.add_command(label="Upload to Remote", command=self.upload_selected)
-                context_menu.add_separator()
-            
-            # Single directory operations
-            if is_single_dir:
-                context_menu.add_command(label="Open", command=lambda: self.on_double_click(event))
-                context_menu.add_separator()
-            
-            context_menu.add_command(label="Delete", command=self.delete_files, accelerator="Del")
-            context_menu.add_command(label="Rename", command=self.rename_file)
+        context_menu.add_command(label="Copy", command=self.copy_files, accelerator="Ctrl+C")
+        context_menu.add_command(label="Cut", command=self.cut_files, accelerator="Ctrl+X")
+        context_menu.add_separator()
+        
+        # Transfer operations
+        if self.drop_target:
+            if self.is_remote:
+                context_menu.add_command(label="Download to Local", command=self.download_selected)
+            else:
+                context_menu.add_command(label="Upload to Remote", command=self.upload_selected)
             context_menu.add_separator()
         
+        # Single directory operations
+        context_menu.add_command(label="Open", command=lambda: self.on_double_click(None))
+        entries["open"] = context_menu.index(tk.END)
+        context_menu.add_separator()
+        
+        context_menu.add_command(label="Delete", command=self.delete_files, accelerator="Del")
+        context_menu.add_command(label="Rename", command=self.rename_file)
+        context_menu.add_separator()
+        
         # Paste operation
-        if self.clipboard["files"]:
-            paste_label = f"Paste ({len(self.clipboard['files'])} items)"
-            context_menu.add_command(label=paste_label, command=self.paste_files, accelerator="Ctrl+V")
-            context_menu.add_separator()
+        context_menu.add_command(label="Paste", command=self.paste_files, accelerator="Ctrl+V")
+        entries["paste"] = context_menu.index(tk.END)
+        context_menu.add_separator()
         
         # General operations
         context_menu.add_command(label="New Folder", command=self.create_folder)
         context_menu.add_command(label="Refresh", command=self.refresh_list, accelerator="F5")
         
         # Properties
-        if len(selected_files) == 1:
-            context_menu.add_separator()
-            context_menu.add_command(label="Properties", command=self.show_properties)
+        context_menu.add_separator()
+        context_menu.add_command(label="Properties", command=self.show_properties)
+        entries["properties"] = context_menu.index(tk.END)
+        
+        return context_menu
+    
+    def show_context_menu(self, event):
+        """Show context menu for file operations."""
+        selection = self.file_tree.selection()
+        if not selection:
+            return
+        
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
+        context_menu = self._context_menu
+        entries = self._context_entries
+        
+        # Enable only the entries that apply to this selection
+        is_single = len(selection) == 1
+        is_single_dir = is_single and self._row_data[selection[0]]["is_directory"]
+        context_menu.entryconfigure(entries["open"], state=tk.NORMAL if is_single_dir else tk.DISABLED)
+        context_menu.entryconfigure(entries["properties"], state=tk.NORMAL if is_single else tk.DISABLED)
+        
+        clipboard_count = len(self.clipboard["files"])
+        context_menu.entryconfigure(
+            entries["paste"],
+            label=f"Paste ({clipboard_count} items)" if clipboard_count else "Paste",
+            state=tk.NORMAL if clipboard_count else tk.DISABLED
+        )
         
         # Show the menu
         try:
@@ -818,7 +1167,7 @@ class FileListFrame(ttk.Frame):
                 "operation": "copy",
                 "source_frame": self
             }
-            self.logger.info(f"Copied {len(selected_files)} files to clipboard")
+            self.logger.info("Copied %d files to clipboard", len(selected_files))
             # Visual feedback
             self.after(100, lambda: messagebox.showinfo("Copy", f"Copied {len(selected_files)} items"))
     
@@ -831,7 +1180,7 @@ class FileListFrame(ttk.Frame):
                 "operation": "cut",
                 "source_frame": self
             }
-            self.logger.info(f"Cut {len(selected_files)} files to clipboard")
+            self.logger.info("Cut %d files to clipboard", len(selected_files))
             # Visual feedback - could highlight cut files differently
             self.after(100, lambda: messagebox.showinfo("Cut", f"Cut {len(selected_files)} items"))
     
@@ -852,7 +1201,7 @@ class FileListFrame(ttk.Frame):
             dest_type = "remote" if self.is_remote else "local"
             
             # Show confirmation dialog
-            confirm_key = f"transfer.confirm_{source_type}_to_{dest_type}"
+            confirm_key = _CONFIRM_KEYS[source_type, dest_type]
             should_confirm = True
             
             if self.config_manager:
@@ -926,7 +1275,10 @@ class FileListFrame(ttk.Frame):
         
         if result:
             self.logger.info(f"Deleting {len(selected_files)} files")
-            messagebox.showinfo("Delete", f"Delete operation for {len(selected_files)} items not yet implemented")
+            row_data = self._row_data
+            entries = [(row_data[item]["name"], self.join_path(row_data[item]["name"]),
+                        row_data[item]["is_directory"]) for item in self.file_tree.selection()]
+            self._start_operation(self._delete_entries, entries)
     
     def rename_file(self):
         """Rename selected file."""
@@ -944,11 +1296,78 @@ class FileListFrame(ttk.Frame):
     
     def create_folder(self):
         """Create a new folder."""
+        if self.is_remote and (not self.sftp_client or not self.sftp_client.is_connected):
+            messagebox.showwarning("New Folder", "Not connected to server")
+            return
+        
         folder_name = simpledialog.askstring("New Folder", "Enter folder name:")
         
         if folder_name:
             self.logger.info(f"Creating folder: {folder_name}")
-            messagebox.showinfo("New Folder", f"Create folder operation not yet implemented")
+            self._start_operation(self._create_directory, folder_name, self.join_path(folder_name))
+    
+    def _start_operation(self, operation, *args):
+        """Run a blocking file operation through the job runner, then refresh the list."""
+        self.file_tree.configure(cursor="watch")
+        self._start_job(self._run_operation, operation, *args, runner=self.job_runner)
+    
+    def _run_operation(self, operation, *args):
+        """Run a file operation and post its failures to the Tk thread (worker thread)."""
+        try:
+            failures = operation(*args)
+        except Exception as e:
+            self.logger.error(f"File operation failed: {e}")
+            failures = [str(e)]
+        self._post(self._operation_finished, failures)
+    
+    def _operation_finished(self, failures: List[str]):
+        """Report failed items and show the directory's new contents."""
+        self.file_tree.configure(cursor="")
+        if failures:
+            messagebox.showerror("Error", "\n".join(failures))
+        self.refresh_list()
+    
+    def _delete_entries(self, entries: List[tuple]) -> List[str]:
+        """Delete (name, path, is_directory) entries; directories must be empty (worker thread)."""
+        failures = []
+        if self.is_remote:
+            # Remote files go as one concurrent batch; directories follow one by one
+            files = [(name, path) for name, path, is_directory in entries if not is_directory]
+            results = self.sftp_client.delete_remote_files([path for _, path in files])
+            failures.extend(f"Could not delete {name}" for (name, _), deleted in zip(files, results)
+                            if not deleted)
+            entries = [entry for entry in entries if entry[2]]
+        
+        for name, path, is_directory in entries:
+            try:
+                if self.is_remote:
+                    deleted = self.sftp_client.delete_remote_directory(path)
+                else:
+                    if is_directory:
+                        os.rmdir(path)
+                    else:
+                        os.remove(path)
+                    deleted = True
+            except OSError as e:
+                self.logger.error(f"Failed to delete {path}: {e}")
+                deleted = False
+            
+            if not deleted:
+                failures.append(f"Could not delete {name}")
+        return failures
+    
+    def _create_directory(self, name: str, path: str) -> List[str]:
+        """Create one directory, returning a failure message list (worker thread)."""
+        if self.is_remote:
+            if self.sftp_client.create_remote_directory(path):
+                return []
+        else:
+            try:
+                os.mkdir(path)
+                return []
+            except OSError as e:
+                self.logger.error(f"Failed to create {path}: {e}")
+        return [f"Could not create folder {name}"]
     
     def show_properties(self):
         """Show properties of selected file."""
@@ -958,13 +1377,13 @@ class FileListFrame(ttk.Frame):
         
         filename = selected_files[0]
         selection = self.file_tree.selection()[0]
-        item = self.file_tree.item(selection)
+        values = self.file_tree.item(selection, "values")
         
         properties = f"Name: {filename}\n"
-        properties += f"Size: {item['values'][1]}\n"
-        properties += f"Modified: {item['values'][2]}\n"
-        properties += f"Permissions: {item['values'][3]}\n"
-        properties += f"Type: {'Directory' if 'directory' in self.file_tree.item(selection, 'tags') else 'File'}"
+        properties += f"Size: {values[1]}\n"
+        properties += f"Modified: {values[2]}\n"
+        properties += f"Permissions: {values[3]}\n"
+        properties += f"Type: {'Directory' if self._row_data[selection]['is_directory'] else 'File'}"
         
         messagebox.showinfo(f"Properties - {filename}", properties)
     
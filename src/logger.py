@@ -6,15 +6,22 @@ for error handling throughout the SFTP client application.
 """
 
 import os
+import atexit
 import logging
 import logging.handlers
+import queue
 import traceback
+import types
+import weakref
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 import threading
 
+# Default log directory: logs/ next to the src package
+_DEFAULT_LOG_DIR = Path(__file__).parent.parent / "logs"
+
 
 class SFTPLogger:
     """
@@ -34,17 +41,21 @@ class SFTPLogger:
         
         if log_dir is None:
             # Default to logs directory relative to application
-            self.log_dir = Path(__file__).parent.parent / "logs"
+            self.log_dir = _DEFAULT_LOG_DIR
         else:
             self.log_dir = Path(log_dir)
         
-        self.log_dir.mkdir(exist_ok=True)
+        if not os.path.isdir(self.log_dir):
+            self.log_dir.mkdir(exist_ok=True)
         
         self.main_log_file = self.log_dir / f"{app_name}.log"
         self.error_log_file = self.log_dir / f"{app_name}_errors.log"
         
         self.logger = None
+        self._console_handler = None
+        self._listener = None
         self._setup_logging()
+        atexit.register(self.stop)
     
     def _setup_logging(self):
         """Set up logging configuration."""
@@ -89,14 +100,20 @@ class SFTPLogger:
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(simple_formatter)
         
-        # Add handlers to logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(error_handler)
-        self.logger.addHandler(console_handler)
+        # Loggers only enqueue records; one listener thread does the file
+        # and console writes, so callers never wait on disk I/O
+        self._console_handler = console_handler
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, error_handler, console_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
         
         # Log startup
-        self.logger.info(f"Logger initialized for {self.app_name}")
-        self.logger.info(f"Log directory: {self.log_dir}")
+        self.logger.info("Logger initialized for %s", self.app_name)
+        self.logger.info("Log directory: %s", self.log_dir)
     
     def get_logger(self, name: str = None) -> logging.Logger:
         """
@@ -124,10 +141,13 @@ class SFTPLogger:
         self.logger.setLevel(numeric_level)
         
         # Update console handler level
-        for handler in self.logger.handlers:
-            if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-                handler.setLevel(numeric_level)
-                break
+        self._console_handler.setLevel(numeric_level)
+    
+    def stop(self):
+        """Flush queued records and stop the logging listener thread."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
     
     def log_exception(self, exception: Exception, context: str = None):
         """
@@ -137,16 +157,30 @@ class SFTPLogger:
             exception: Exception to log
             context: Additional context information
         """
-        error_msg = f"Exception occurred: {type(exception).__name__}: {str(exception)}"
         if context:
-            error_msg = f"{context} - {error_msg}"
+            self.logger.error("%s - Exception occurred: %s: %s", context, type(exception).__name__, exception)
+        else:
+            self.logger.error("Exception occurred: %s: %s", type(exception).__name__, exception)
+        self.logger.error("Traceback: %s", traceback.format_exc())
+    
+    def cleanup_old_logs(self, days: int = 30) -> threading.Thread:
+        """
+        Clean up log files older than specified days in a background thread.
         
-        self.logger.error(error_msg)
-        self.logger.error(f"Traceback: {traceback.format_exc()}")
+        Args:
+            days: Number of days to keep logs
+            
+        Returns:
+            The worker thread, so callers can join() it if they need to
+        """
+        worker = threading.Thread(target=self._cleanup_old_logs_sync, args=(days,),
+                                  name="log-cleanup", daemon=True)
+        worker.start()
+        return worker
     
-    def cleanup_old_logs(self, days: int = 30):
+    def _cleanup_old_logs_sync(self, days: int):
         """
-        Clean up log files older than specified days.
+        Delete log files older than specified days (runs on the worker thread).
         
         Args:
             days: Number of days to keep logs
@@ -154,13 +188,17 @@ class SFTPLogger:
         try:
             cutoff_time = datetime.now().timestamp() - (days * 24 * 60 * 60)
             
-            for log_file in self.log_dir.glob("*.log*"):
-                if log_file.stat().st_mtime < cutoff_time:
-                    log_file.unlink()
-                    self.logger.info(f"Deleted old log file: {log_file}")
+            # scandir's entries carry their own stat, avoiding a second lookup per file
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    if ".log" not in entry.name or not entry.is_file(follow_symlinks=False):
+                        continue
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        self.logger.info("Deleted old log file: %s", entry.path)
                     
         except Exception as e:
-            self.logger.error(f"Failed to cleanup old logs: {e}")
+            self.logger.error("Failed to cleanup old logs: %s", e)
 
 
 class ErrorHandler:
@@ -176,7 +214,10 @@ class ErrorHandler:
             logger: Logger instance
         """
         self.logger = logger
-        self.error_callbacks = []
+        # Zero-argument references returning each callback (None once a bound
+        # method's object is gone). Replaced, never mutated, so handle_error
+        # can iterate it without the lock
+        self.error_callbacks = ()
         self._lock = threading.Lock()
     
     def add_error_callback(self, callback):
@@ -186,8 +227,15 @@ class ErrorHandler:
         Args:
             callback: Function to call with error information
         """
+        # Bound methods are held weakly, so a destroyed window's handler is
+        # dropped instead of being kept alive and called forever
+        if isinstance(callback, types.MethodType):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        
         with self._lock:
-            self.error_callbacks.append(callback)
+            self.error_callbacks = self.error_callbacks + (ref,)
     
     def remove_error_callback(self, callback):
         """
@@ -197,11 +245,14 @@ class ErrorHandler:
             callback: Callback function to remove
         """
         with self._lock:
-            if callback in self.error_callbacks:
-                self.error_callbacks.remove(callback)
+            # Dead references are pruned at the same time
+            self.error_callbacks = tuple(
+                ref for ref in self.error_callbacks if ref() not in (None, callback)
+            )
     
     def handle_error(self, error: Exception, context: str = None, 
-                    user_message: str = None, critical: bool = False):
+                    user_message: str = None, critical: bool = False,
+                    formatted_traceback: Optional[str] = None):
         """
         Handle an error with logging and user notification.
         
@@ -210,8 +261,20 @@ class ErrorHandler:
             context: Context where error occurred
             user_message: User-friendly error message
             critical: Whether this is a critical error
+            formatted_traceback: Traceback text the caller already formatted
         """
         # Log the error
+        if critical:
+            self.logger.critical("Critical error in %s: %s", context, error)
+        else:
+            self.logger.error("Error in %s: %s", context, error)
+        
+        # The details dict is only built when something will read it
+        callbacks = self.error_callbacks
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if not callbacks and not debug_enabled:
+            return
+        
         error_info = {
             'type': type(error).__name__,
             'message': str(error),
@@ -221,21 +284,22 @@ class ErrorHandler:
             'thread': threading.current_thread().name
         }
         
-        if critical:
-            self.logger.critical(f"Critical error in {context}: {error}")
-        else:
-            self.logger.error(f"Error in {context}: {error}")
-        
-        self.logger.debug(f"Full error details: {error_info}")
-        self.logger.debug(f"Traceback: {traceback.format_exc()}")
-        
-        # Notify callbacks
-        with self._lock:
-            for callback in self.error_callbacks:
-                try:
-                    callback(error_info, user_message)
-                except Exception as e:
-                    self.logger.error(f"Error in error callback: {e}")
+        # Formatting the traceback walks every frame; skip it when nobody logs DEBUG
+        if debug_enabled:
+            self.logger.debug("Full error details: %s", error_info)
+            if formatted_traceback is None:
+                formatted_traceback = traceback.format_exc()
+            self.logger.debug("Traceback: %s", formatted_traceback)
+        
+        # Notify callbacks; slow callbacks no longer hold up other threads
+        for ref in callbacks:
+            callback = ref()
+            if callback is None:
+                continue
+            try:
+                callback(error_info, user_message)
+            except Exception as e:
+                self.logger.error("Error in error callback: %s", e)
     
     def handle_connection_error(self, error: Exception, host: str = None):
         """
@@ -328,21 +392,22 @@ class ApplicationExceptionHandler:
             exc_value: Exception value
             exc_traceback: Exception traceback
         """
-        if issubclass(exc_type, KeyboardInterrupt):
-            # Don't handle keyboard interrupt
+        if issubclass(exc_type, (KeyboardInterrupt, SystemExit)):
+            # Don't handle keyboard interrupt or a requested exit
             self.original_excepthook(exc_type, exc_value, exc_traceback)
             return
         
-        error_msg = f"Unhandled exception: {exc_type.__name__}: {exc_value}"
-        self.logger.critical(error_msg)
-        self.logger.critical("".join(traceback.format_exception(exc_type, exc_value, exc_traceback)))
+        self.logger.critical("Unhandled exception: %s: %s", exc_type.__name__, exc_value)
+        formatted_traceback = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        self.logger.critical(formatted_traceback)
         
         # Call error handler
         self.error_handler.handle_error(
             exc_value, 
             "unhandled exception", 
             "An unexpected error occurred. Please check the logs for details.",
-            critical=True
+            critical=True,
+            formatted_traceback=formatted_traceback
         )
     
     def handle_thread_exception(self, args):
@@ -352,16 +417,24 @@ class ApplicationExceptionHandler:
         Args:
             args: Thread exception arguments
         """
-        error_msg = f"Unhandled exception in thread {args.thread.name}: {args.exc_type.__name__}: {args.exc_value}"
-        self.logger.critical(error_msg)
-        self.logger.critical("".join(traceback.format_exception(args.exc_type, args.exc_value, args.exc_traceback)))
+        if issubclass(args.exc_type, SystemExit):
+            # sys.exit() in a thread just ends it, as with the default hook
+            return
+        
+        self.logger.critical("Unhandled exception in thread %s: %s: %s",
+                             args.thread.name, args.exc_type.__name__, args.exc_value)
+        formatted_traceback = "".join(
+            traceback.format_exception(args.exc_type, args.exc_value, args.exc_traceback)
+        )
+        self.logger.critical(formatted_traceback)
         
         # Call error handler
         self.error_handler.handle_error(
             args.exc_value,
             f"thread {args.thread.name}",
             "An unexpected error occurred in a background thread.",
-            critical=True
+            critical=True,
+            formatted_traceback=formatted_traceback
         )
 
 
@@ -7,16 +7,21 @@ all the GUI components.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
+import itertools
 import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, Any
 import logging
 
-from sftp_client import SFTPClient
+from sftp_client_asyncssh import create_sftp_client
 from config_manager import ConfigManager
 from logger import setup_application_logging, ErrorHandler
 from gui import ConnectionDialog, FileListFrame, ProgressDialog, DragDropConfirmDialog
 
+# Width and height at the start of a Tk geometry string such as "1200x800+10+10"
+_GEOMETRY_RE = re.compile(r"(\d+)x(\d+)")
+
 
 class SFTPClientApp:
     """Main SFTP Client Application."""
@@ -29,7 +34,15 @@ class SFTPClientApp:
         
         # Initialize components
         self.config_manager = ConfigManager()
-        self.sftp_client = SFTPClient()
+        # paramiko unless the settings opt in to the asyncssh backend
+        self.sftp_client = create_sftp_client(
+            self.config_manager.get_setting("connection.backend", "paramiko"))
+        
+        # A socket_buffer_mb of 0 leaves TCP buffer sizing to the OS
+        buffer_mb = self.config_manager.get_setting("connection.socket_buffer_mb", 0)
+        self.sftp_client.socket_buffer_size = int(buffer_mb * 1024 * 1024) or None
+        self.sftp_client.keepalive_interval = int(
+            self.config_manager.get_setting("connection.keep_alive_interval", 60))
         
         # GUI components
         self.root = None
@@ -42,6 +55,11 @@ class SFTPClientApp:
         self.is_connected = False
         self.current_connection = None
         
+        # Connects and transfers run on these reused worker threads; jobs not
+        # yet known to be finished are kept so shutdown can cancel them
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sftp")
+        self._jobs = set()
+        
         # Setup callbacks
         self.sftp_client.set_status_callback(self.update_status)
         self.sftp_client.set_progress_callback(self.update_progress)
@@ -161,6 +179,10 @@ class SFTPClientApp:
         self.remote_frame = FileListFrame(remote_container, "Remote Files", is_remote=True)
         self.remote_frame.pack(fill=tk.BOTH, expand=True)
         
+        # Deletes and new folders share the app's worker threads
+        self.local_frame.set_job_runner(self.run_in_background)
+        self.remote_frame.set_job_runner(self.run_in_background)
+        
         # Set up drag-and-drop between frames
         self.setup_drag_and_drop()
     
@@ -204,46 +226,25 @@ class SFTPClientApp:
             action = "upload" if upload else "download"
             file_count = len(files)
             self.update_status(f"Starting {action} of {file_count} item(s)...")
+            entries, remote_dir = self._plan_transfer(files, upload)
             
             # Start transfer in background thread
             def transfer_thread():
                 try:
-                    for filename in files:
-                        if upload:
-                            # Upload from local to remote
-                            local_path = os.path.join(self.local_frame.get_current_path(), filename)
-                            remote_path = f"{self.remote_frame.get_current_path().rstrip('/')}/{filename}"
-                            
-                            if os.path.isfile(local_path):
-                                success = self.sftp_client.upload_file(local_path, remote_path)
-                                if not success:
-                                    self.root.after(0, lambda f=filename: self.update_status(f"Failed to upload {f}"))
-                                    return
-                            elif os.path.isdir(local_path):
-                                # For directories, create remote directory (basic implementation)
-                                success = self.sftp_client.create_remote_directory(remote_path)
-                                if not success:
-                                    self.root.after(0, lambda f=filename: self.update_status(f"Failed to create directory {f}"))
-                                    return
-                        else:
-                            # Download from remote to local
-                            remote_path = f"{self.remote_frame.get_current_path().rstrip('/')}/{filename}"
-                            local_path = os.path.join(self.local_frame.get_current_path(), filename)
-                            
-                            success = self.sftp_client.download_file(remote_path, local_path)
-                            if not success:
-                                self.root.after(0, lambda f=filename: self.update_status(f"Failed to download {f}"))
-                                return
+                    error = self._transfer_batch(entries, upload, remote_dir)
+                    if error:
+                        self.root.after(0, lambda: self.update_status(error))
+                        return
                     
-                    # Refresh both panels and update status
-                    self.root.after(0, self.refresh_all)
+                    # Refresh the receiving panel and update status
+                    self.root.after(0, self.refresh_destination, upload)
                     self.root.after(0, lambda: self.update_status(f"{action.capitalize()} completed successfully"))
                     
                 except Exception as e:
                     self.logger.error(f"Drag-drop transfer error: {e}")
                     self.root.after(0, lambda: self.update_status(f"{action.capitalize()} failed: {str(e)}"))
             
-            threading.Thread(target=transfer_thread, daemon=True).start()
+            self.run_in_background(transfer_thread)
             
         except Exception as e:
             self.logger.error(f"Error handling drag-drop transfer: {e}")
@@ -326,7 +327,7 @@ class SFTPClientApp:
                 self.logger.error(f"Connection error: {e}")
                 self.root.after(0, lambda: self.update_status("Connection failed"))
         
-        threading.Thread(target=connect_thread, daemon=True).start()
+        self.run_in_background(connect_thread)
     
     def on_connected(self):
         """Handle successful connection."""
@@ -374,43 +375,120 @@ class SFTPClientApp:
     
     def transfer_files(self, files: list, upload: bool):
         """Transfer files between local and remote."""
+        entries, remote_dir = self._plan_transfer(files, upload)
+        
         def transfer_thread():
             try:
                 self.update_status(f"Transferring {len(files)} file(s)...")
                 
-                for filename in files:
-                    if upload:
-                        local_path = os.path.join(self.local_frame.get_current_path(), filename)
-                        remote_path = f"{self.remote_frame.get_current_path().rstrip('/')}/{filename}"
-                        
-                        if os.path.isfile(local_path):
-                            success = self.sftp_client.upload_file(local_path, remote_path)
-                            if not success:
-                                self.root.after(0, lambda f=filename: self.update_status(f"Failed to upload {f}"))
-                                return
-                        elif os.path.isdir(local_path):
-                            success = self.sftp_client.create_remote_directory(remote_path)
-                            if not success:
-                                self.root.after(0, lambda f=filename: self.update_status(f"Failed to create directory {f}"))
-                                return
-                    else:
-                        remote_path = f"{self.remote_frame.get_current_path().rstrip('/')}/{filename}"
-                        local_path = os.path.join(self.local_frame.get_current_path(), filename)
-                        
-                        success = self.sftp_client.download_file(remote_path, local_path)
-                        if not success:
-                            self.root.after(0, lambda f=filename: self.update_status(f"Failed to download {f}"))
-                            return
+                error = self._transfer_batch(entries, upload, remote_dir)
+                if error:
+                    self.root.after(0, lambda: self.update_status(error))
+                    return
                 
-                # Refresh both panels
-                self.root.after(0, self.refresh_all)
+                # Only the receiving panel has changed
+                self.root.after(0, self.refresh_destination, upload)
                 self.root.after(0, lambda: self.update_status("Transfer completed"))
                 
             except Exception as e:
                 self.logger.error(f"Transfer error: {e}")
                 self.root.after(0, lambda: self.update_status("Transfer failed"))
         
-        threading.Thread(target=transfer_thread, daemon=True).start()
+        self.run_in_background(transfer_thread)
+    
+    def _plan_transfer(self, files: list, upload: bool) -> tuple:
+        """
+        Resolve the named entries against both panels' current directories (Tk thread).
+        
+        Done before the job is queued, so browsing elsewhere while it waits
+        for a worker cannot change where files are read from or written to.
+        
+        Args:
+            files: Names of the selected entries in the source panel
+            upload: True for local to remote, False for remote to local
+            
+        Returns:
+            tuple: ([(name, local_path, remote_path, is_remote_directory)],
+            remote directory the entries go into or come from)
+        """
+        remote_directories = set() if upload else self.remote_frame.get_directory_names()
+        entries = [(filename, self.local_frame.join_path(filename),
+                    self.remote_frame.join_path(filename), filename in remote_directories)
+                   for filename in files]
+        return entries, self.remote_frame.current_path
+    
+    def _transfer_batch(self, entries: list, upload: bool, remote_dir: str) -> Optional[str]:
+        """
+        Transfer entries planned by _plan_transfer() (worker thread).
+        
+        Directories are copied with their contents, one tree at a time;
+        the remaining files are then sent as a single concurrent batch.
+        
+        Args:
+            entries: (name, local_path, remote_path, is_remote_directory) tuples
+            upload: True for local to remote, False for remote to local
+            remote_dir: Remote directory of the entries, for bulk uploads
+            
+        Returns:
+            Optional[str]: Status message for the first failure, or None
+        """
+        names = []
+        pairs = []
+        for filename, local_path, remote_path, is_remote_directory in entries:
+            if not upload:
+                if is_remote_directory:
+                    if not self.sftp_client.download_directory(remote_path, local_path):
+                        return f"Failed to download directory {filename}"
+                else:
+                    names.append(filename)
+                    pairs.append((remote_path, local_path))
+            elif os.path.isfile(local_path):
+                names.append(filename)
+                pairs.append((local_path, remote_path))
+            elif os.path.isdir(local_path):
+                if not self.sftp_client.upload_directory(local_path, remote_path):
+                    return f"Failed to upload directory {filename}"
+        
+        # Post a status line as each file finishes; the counter's next() is atomic
+        verb = "Uploaded" if upload else "Downloaded"
+        finished = itertools.count(1)
+        
+        def file_done(index, success):
+            if success:
+                message = f"{verb} {names[index]} ({next(finished)}/{len(pairs)})"
+                self.root.after(0, self.update_status, message)
+        
+        # Many small uploads go fastest as one tar stream, when the server allows it
+        if upload and len(pairs) > self.sftp_client.bulk_upload_threshold:
+            local_paths = [local_path for local_path, _ in pairs]
+            if self.sftp_client.bulk_upload(local_paths, remote_dir, file_callback=file_done):
+                return None
+            self.logger.info("Bulk upload unavailable, sending files individually")
+        
+        results = self.sftp_client.transfer_files(pairs, upload, file_callback=file_done)
+        for filename, success in zip(names, results):
+            if not success:
+                return f"Failed to {'upload' if upload else 'download'} {filename}"
+        return None
+    
+    def run_in_background(self, fn, *args) -> Future:
+        """
+        Run fn(*args) on the application's worker threads.
+        
+        Only call this from the Tk thread, which is the only one touching
+        the job set.
+        
+        Args:
+            fn: Callable to run off the Tk thread
+            *args: Arguments for fn
+            
+        Returns:
+            Future: The submitted job
+        """
+        self._jobs = {job for job in self._jobs if not job.done()}
+        job = self._executor.submit(fn, *args)
+        self._jobs.add(job)
+        return job
     
     def refresh_all(self):
         """Refresh both file panels."""
@@ -418,6 +496,13 @@ class SFTPClientApp:
         if self.is_connected:
             self.remote_frame.refresh_list()
     
+    def refresh_destination(self, upload: bool):
+        """Refresh the panel a finished transfer wrote into; the source is unchanged."""
+        if not upload:
+            self.local_frame.refresh_list()
+        elif self.is_connected:
+            self.remote_frame.refresh_list()
+    
     def update_status(self, message: str):
         """Update status bar."""
         if self.status_var:
@@ -460,10 +545,9 @@ class SFTPClientApp:
             settings['window']['maximized'] = True
         else:
             settings['window']['maximized'] = False
-            geometry = self.root.geometry()
-            width, height = geometry.split('+')[0].split('x')
-            settings['window']['width'] = int(width)
-            settings['window']['height'] = int(height)
+            match = _GEOMETRY_RE.match(self.root.geometry())
+            settings['window']['width'] = int(match[1])
+            settings['window']['height'] = int(match[2])
         
         self.config_manager.save_settings(settings)
     
@@ -471,8 +555,19 @@ class SFTPClientApp:
         """Handle application closing."""
         try:
             self.save_settings()
-            if self.is_connected:
-                self.disconnect()
+            
+            # Queued jobs are dropped; running ones end once the connection is
+            # gone. Cancelled one by one, as cancel_futures needs Python 3.9
+            for job in self._jobs:
+                job.cancel()
+            
+            # No clean close on the way out; a slow link would hold up the exit.
+            # Also aborts a connect still in progress, whose worker thread the
+            # interpreter would otherwise wait for at exit
+            self.sftp_client.force_close()
+            self.is_connected = False
+            self.sftp_client.close_pool()
+            self._executor.shutdown(wait=False)
             
             # Cleanup logging
             if hasattr(self, 'exception_handler'):
@@ -531,14 +626,19 @@ class SFTPClientApp:
                 messagebox.showerror("Error", "Failed to export connections")
     
     def create_directory(self):
-        """Create new directory."""
-        # This would show a dialog to create directory
-        messagebox.showinfo("Info", "Create directory dialog would open here")
+        """Create new directory in the focused panel."""
+        self._active_frame().create_folder()
     
     def delete_selected(self):
-        """Delete selected files/directories."""
-        # This would delete selected items with confirmation
-        messagebox.showinfo("Info", "Delete confirmation dialog would open here")
+        """Delete selected files/directories in the focused panel."""
+        self._active_frame().delete_files()
+    
+    def _active_frame(self) -> FileListFrame:
+        """Return the panel holding keyboard focus, defaulting to the local one."""
+        focus = self.root.focus_get()
+        if focus is not None and self.remote_frame.is_widget_in_frame(focus, self.remote_frame):
+            return self.remote_frame
+        return self.local_frame
     
     def toggle_hidden_files(self):
         """Toggle showing hidden files."""
@@ -6,14 +6,183 @@ It handles connections, file operations, and directory management.
 """
 
 import os
+import posixpath
 import stat
+import hashlib
 import logging
-import paramiko
-from typing import List, Optional, Tuple, Dict, Any
+import shlex
+import socket
+import tarfile
+from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Any
 from pathlib import Path
 from datetime import datetime
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# paramiko takes ~0.1 s to import, so it is loaded on the first connect()
+if TYPE_CHECKING:
+    import paramiko
+
+# Authenticated SSH clients and their SFTP sessions parked by
+# disconnect(keep_alive=True), so reconnecting to the same server skips the TCP
+# handshake, key exchange, authentication and SFTP setup. Each key holds a
+# stack; the newest is reused first
+_IDLE_CLIENT_TTL = 60.0
+_MAX_IDLE_PER_KEY = 8
+_idle_clients: Dict[tuple, List[Tuple['paramiko.SSHClient', 'paramiko.SFTPClient', float]]] = {}
+_idle_lock = threading.Lock()
+
+# The one pending timer that closes expired parked clients, guarded by _idle_lock
+_reaper: Optional[threading.Timer] = None
+
+# Parsed private keys by (path, mtime_ns, password digest), so reconnects skip
+# reading and decrypting the key file. Least recently used first; kept small
+# and cleared by close_pool(), as these hold unlocked key material
+_MAX_PRIVATE_KEYS = 4
+_private_keys: 'OrderedDict[tuple, paramiko.PKey]' = OrderedDict()
+_private_keys_lock = threading.Lock()
+
+
+def _pool_key(host: str, port: int, username: str, password: Optional[str],
+              private_key_path: Optional[str]) -> tuple:
+    """Key a pooled client by server, user and a digest of the credentials."""
+    credentials = f"{private_key_path or ''}\0{password or ''}".encode()
+    return (host, port, username, hashlib.sha256(credentials).hexdigest())
+
+
+def _load_private_key(path: str, password: Optional[str]) -> 'paramiko.PKey':
+    """
+    Load an RSA, ECDSA or Ed25519 private key, reusing it while the file is unchanged.
+    
+    Args:
+        path: Private key file
+        password: Password for an encrypted key (ignored for plain keys)
+        
+    Returns:
+        paramiko.PKey: Key of the type found in the file
+        
+    Raises:
+        paramiko.PasswordRequiredException: The key is encrypted and no password was given
+    """
+    import paramiko
+    
+    digest = hashlib.sha256((password or '').encode()).hexdigest()
+    cache_key = (path, os.stat(path).st_mtime_ns, digest)
+    with _private_keys_lock:
+        pkey = _private_keys.get(cache_key)
+        if pkey is not None:
+            _private_keys.move_to_end(cache_key)
+            return pkey
+    
+    try:
+        pkey = paramiko.PKey.from_path(path)
+    except TypeError:
+        # cryptography reports an encrypted key as a missing password
+        if not password:
+            raise paramiko.PasswordRequiredException("Private key file is encrypted")
+        pkey = paramiko.PKey.from_path(path, password.encode())
+    
+    with _private_keys_lock:
+        # Earlier versions of the same file are of no further use
+        for stale in [key for key in _private_keys if key[0] == path]:
+            del _private_keys[stale]
+        _private_keys[cache_key] = pkey
+        while len(_private_keys) > _MAX_PRIVATE_KEYS:
+            _private_keys.popitem(last=False)
+    return pkey
+
+
+def _take_idle_client(key: tuple) -> Optional[Tuple['paramiko.SSHClient', 'paramiko.SFTPClient']]:
+    """Return the newest parked (client, sftp) pair for key that is still fresh and connected."""
+    while True:
+        with _idle_lock:
+            stack = _idle_clients.get(key)
+            if not stack:
+                return None
+            client, sftp, expires = stack.pop()
+            if not stack:
+                del _idle_clients[key]
+        
+        transport = client.get_transport()
+        if (time.monotonic() < expires and transport is not None and transport.is_active()
+                and not sftp.get_channel().closed):
+            return client, sftp
+        client.close()
+
+
+def _park_client(key: tuple, client: 'paramiko.SSHClient', sftp: 'paramiko.SFTPClient'):
+    """Keep a client and its SFTP session open for reuse until the idle timeout passes."""
+    with _idle_lock:
+        stack = _idle_clients.setdefault(key, [])
+        stack.append((client, sftp, time.monotonic() + _IDLE_CLIENT_TTL))
+        # Past the limit the longest-parked client makes room
+        overflow = stack.pop(0) if len(stack) > _MAX_IDLE_PER_KEY else None
+        _schedule_reaper(_IDLE_CLIENT_TTL)
+    if overflow is not None:
+        overflow[0].close()
+
+
+def _schedule_reaper(delay: float):
+    """Start the expiry timer unless one is already pending (call with _idle_lock held)."""
+    global _reaper
+    if _reaper is None:
+        # A little slack so the clients it was started for have expired
+        _reaper = threading.Timer(delay + 0.5, _close_expired_clients)
+        _reaper.daemon = True
+        _reaper.start()
+
+
+def _close_expired_clients():
+    """Close parked clients whose idle timeout has passed, then re-arm for the rest."""
+    global _reaper
+    now = time.monotonic()
+    clients = []
+    with _idle_lock:
+        _reaper = None
+        for key, stack in list(_idle_clients.items()):
+            clients.extend(client for client, _, expires in stack if expires <= now)
+            stack[:] = [entry for entry in stack if entry[2] > now]
+            if not stack:
+                del _idle_clients[key]
+        if _idle_clients:
+            next_expiry = min(stack[0][2] for stack in _idle_clients.values())
+            _schedule_reaper(next_expiry - now)
+    for client in clients:
+        client.close()
+
+
+def _drop_connection(client: 'paramiko.SSHClient'):
+    """Shut a client's socket down without the SFTP and SSH close handshakes."""
+    transport = client.get_transport()
+    if transport is not None and transport.sock is not None:
+        try:
+            transport.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        transport.sock.close()
+
+
+class _CountingReader:
+    """File wrapper that reports how many bytes each read() returned."""
+    
+    def __init__(self, file, on_read):
+        self.file = file
+        self.on_read = on_read
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self.file.read(size)
+        self.on_read(len(data))
+        return data
+
+
+def _neutral_tarinfo(info: tarfile.TarInfo) -> tarfile.TarInfo:
+    """Strip local ownership and permissions so the server applies its own defaults."""
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    info.mode = 0o644
+    return info
 
 
 class SFTPClient:
@@ -34,9 +203,53 @@ class SFTPClient:
         self.current_local_path = os.getcwd()
         self.logger = logging.getLogger(__name__)
         
+        # Key of the idle pool this connection can return to on disconnect()
+        self._pool_key = None
+        
+        # Socket of a connect() still in progress, and whether force_close()
+        # has aborted it, so shutdown does not wait out a slow connect
+        self._connecting_sock = None
+        self._connect_aborted = False
+        
+        # paramiko SFTP sessions must not be shared between threads, and the
+        # GUI lists, transfers and deletes from several; every request on the
+        # main session (self.sftp_client) is made holding this lock
+        self._session_lock = threading.RLock()
+        
         # Connection timeout in seconds
         self.timeout = 30
         
+        # TCP send/receive buffer size in bytes; None leaves sizing to the OS
+        self.socket_buffer_size = None
+        
+        # Ciphers offered ahead of paramiko's defaults; AES-GCM needs no
+        # separate MAC pass and is far faster on CPUs with AES-NI
+        self.preferred_ciphers = ("aes128-gcm@openssh.com", "aes256-gcm@openssh.com")
+        
+        # Receive window of each channel in bytes: how much the server may
+        # send before waiting for our ack. paramiko's 2 MiB default caps a
+        # download at 2 MiB per round trip; None keeps that default
+        self.channel_window_size = 8 * 1024 * 1024
+        
+        # Seconds between SSH keepalive messages, so NAT and firewall state
+        # survives idle and parked connections; 0 disables them. The app sets
+        # it from the connection.keep_alive_interval setting
+        self.keepalive_interval = 0
+        
+        # Files transferred at once by transfer_files()
+        self.max_parallel_transfers = 4
+        
+        # Sessions one SSH connection may hold at once; OpenSSH's default
+        # MaxSessions, beyond which the server refuses new channels
+        self.max_channels = 10
+        
+        # Extra channels (beyond the main session) free across every batch
+        # this client runs at once; max_channels is read only here
+        self._channel_slots = threading.BoundedSemaphore(self.max_channels - 1)
+        
+        # Uploads of more files than this are first tried as one tar stream
+        self.bulk_upload_threshold = 8
+        
         # Callbacks for progress and status updates
         self.progress_callback = None
         self.status_callback = None
@@ -56,56 +269,29 @@ class SFTPClient:
         Returns:
             bool: True if connection successful, False otherwise
         """
+        import paramiko
+        
+        self._connect_aborted = False
         try:
             self.host = host
             self.port = port
             self.username = username
             
-            # Create SSH client
-            self.ssh_client = paramiko.SSHClient()
-            self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            # Prepare authentication parameters
-            auth_kwargs = {
-                'hostname': host,
-                'port': port,
-                'username': username,
-                'timeout': self.timeout
-            }
-            
-            # Use private key or password authentication
-            if private_key_path and os.path.exists(private_key_path):
-                try:
-                    private_key = paramiko.RSAKey.from_private_key_file(private_key_path)
-                    auth_kwargs['pkey'] = private_key
-                except paramiko.PasswordRequiredException:
-                    # Key is encrypted, need password
-                    if password:
-                        private_key = paramiko.RSAKey.from_private_key_file(
-                            private_key_path, password=password
-                        )
-                        auth_kwargs['pkey'] = private_key
-                    else:
-                        self.logger.error("Private key is encrypted but no password provided")
-                        return False
-                except Exception as e:
-                    self.logger.error(f"Failed to load private key: {e}")
-                    # Fall back to password authentication
-                    if password:
-                        auth_kwargs['password'] = password
-                    else:
-                        return False
-            elif password:
-                auth_kwargs['password'] = password
+            # Reuse a recently disconnected client for the same server and credentials
+            pool_key = _pool_key(host, port, username, password, private_key_path)
+            idle = _take_idle_client(pool_key)
+            if idle is None:
+                self.ssh_client = self._open_ssh_client(host, username, password,
+                                                        private_key_path, port)
+                if self.ssh_client is None:
+                    return False
+                
+                # Open SFTP session
+                self.sftp_client = self.ssh_client.open_sftp()
             else:
-                self.logger.error("No authentication method provided")
-                return False
-            
-            # Connect to server
-            self.ssh_client.connect(**auth_kwargs)
-            
-            # Open SFTP session
-            self.sftp_client = self.ssh_client.open_sftp()
+                self.ssh_client, self.sftp_client = idle
+                self.logger.info(f"Reusing SSH connection to {host}:{port}")
+            self._pool_key = pool_key
             self.is_connected = True
             
             # Get initial remote directory
@@ -132,17 +318,156 @@ class SFTPClient:
             if self.status_callback:
                 self.status_callback(f"Connection failed: {e}")
             return False
+        finally:
+            self._connecting_sock = None
     
-    def disconnect(self):
-        """Disconnect from the SFTP server."""
+    def _open_ssh_client(self, host: str, username: str, password: Optional[str],
+                         private_key_path: Optional[str], port: int) -> Optional['paramiko.SSHClient']:
+        """
+        Open and authenticate a new SSH connection.
+        
+        Args:
+            host: Server hostname or IP address
+            username: Username for authentication
+            password: Password for authentication (optional if using key)
+            private_key_path: Path to private key file (optional)
+            port: Server port
+            
+        Returns:
+            paramiko.SSHClient or None if no usable credentials were given
+        """
+        import paramiko
+        
+        # Create SSH client
+        ssh_client = paramiko.SSHClient()
+        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        
+        # Prepare authentication parameters
+        auth_kwargs = {
+            'hostname': host,
+            'port': port,
+            'username': username,
+            'timeout': self.timeout,
+            # Compression only costs CPU on fast links and compressed data
+            'compress': False,
+            'transport_factory': self._create_transport
+        }
+        
+        # Use private key or password authentication
+        if private_key_path and os.path.exists(private_key_path):
+            try:
+                auth_kwargs['pkey'] = _load_private_key(private_key_path, password)
+            except paramiko.PasswordRequiredException:
+                self.logger.error("Private key is encrypted but no password provided")
+                return None
+            except Exception as e:
+                self.logger.error(f"Failed to load private key: {e}")
+                # Fall back to password authentication
+                if password:
+                    auth_kwargs['password'] = password
+                else:
+                    return None
+        elif password:
+            auth_kwargs['password'] = password
+        else:
+            self.logger.error("No authentication method provided")
+            return None
+        
+        # Connect to server
+        auth_kwargs['sock'] = sock = self._open_socket(host, port)
         try:
-            if self.sftp_client:
-                self.sftp_client.close()
-                self.sftp_client = None
+            ssh_client.connect(**auth_kwargs)
+        except Exception:
+            sock.close()
+            raise
+        ssh_client.get_transport().set_keepalive(self.keepalive_interval)
+        return ssh_client
+    
+    def _create_transport(self, sock: socket.socket, **kwargs) -> 'paramiko.Transport':
+        """
+        Build the SSH transport, moving preferred_ciphers to the front.
+        
+        Ciphers this paramiko build does not support are skipped, and the
+        remaining defaults stay available for servers without AES-GCM.
+        Channels opened on it get a receive window of channel_window_size.
+        
+        Args:
+            sock: Connected socket from _open_socket()
+            **kwargs: Transport options passed through by paramiko
             
-            if self.ssh_client:
-                self.ssh_client.close()
-                self.ssh_client = None
+        Returns:
+            paramiko.Transport: Transport that has not started negotiating yet
+        """
+        import paramiko
+        
+        transport = paramiko.Transport(sock, **kwargs)
+        if self.channel_window_size:
+            transport.default_window_size = self.channel_window_size
+        options = transport.get_security_options()
+        preferred = [cipher for cipher in self.preferred_ciphers if cipher in options.ciphers]
+        if preferred:
+            options.ciphers = preferred + [cipher for cipher in options.ciphers if cipher not in preferred]
+        return transport
+    
+    def _open_socket(self, host: str, port: int) -> socket.socket:
+        """
+        Open the TCP connection for a new SSH session.
+        
+        Nagle's algorithm is disabled so small SFTP requests and acks are
+        not held back, TCP keepalive lets the OS notice a dead peer, and
+        buffer sizes are applied before connecting so the TCP window
+        scale can reflect them.
+        
+        Args:
+            host: Server hostname or IP address
+            port: Server port
+            
+        Returns:
+            socket.socket: Connected socket
+        """
+        error = None
+        for family, socktype, proto, _, address in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM):
+            if self._connect_aborted:
+                raise OSError("Connect aborted")
+            sock = self._connecting_sock = socket.socket(family, socktype, proto)
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                if self.socket_buffer_size:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.socket_buffer_size)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_buffer_size)
+                sock.settimeout(self.timeout)
+                sock.connect(address)
+                return sock
+            except OSError as e:
+                error = e
+                sock.close()
+        raise error or OSError(f"Could not resolve {host}")
+    
+    def disconnect(self, keep_alive: bool = False):
+        """
+        Disconnect from the SFTP server.
+        
+        Args:
+            keep_alive: Keep a healthy connection and its SFTP session open
+                for a short while, so an immediate connect() to the same
+                server with the same credentials can reuse it. Only for
+                internal hand-overs such as a connection test followed by
+                the real connect; a user's disconnect must really close.
+        """
+        try:
+            transport = self.ssh_client.get_transport() if self.ssh_client else None
+            if (keep_alive and self._pool_key and self.sftp_client and transport is not None
+                    and transport.is_active()):
+                _park_client(self._pool_key, self.ssh_client, self.sftp_client)
+            else:
+                if self.sftp_client:
+                    self.sftp_client.close()
+                if self.ssh_client:
+                    self.ssh_client.close()
+            self.sftp_client = None
+            self.ssh_client = None
+            self._pool_key = None
             
             self.is_connected = False
             self.logger.info("Disconnected from server")
@@ -152,6 +477,55 @@ class SFTPClient:
         except Exception as e:
             self.logger.error(f"Error during disconnect: {e}")
     
+    def force_close(self):
+        """
+        Drop the connection at once, skipping the SFTP and SSH close handshakes.
+        
+        Meant for application shutdown, where a clean close on a slow link
+        would only hold up the exit. The connection is not kept for reuse.
+        A connect() still in progress on another thread is aborted too.
+        """
+        try:
+            self._connect_aborted = True
+            sock = self._connecting_sock
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                sock.close()
+            if self.ssh_client:
+                _drop_connection(self.ssh_client)
+        except Exception as e:
+            self.logger.error(f"Error during forced close: {e}")
+        
+        self.sftp_client = None
+        self.ssh_client = None
+        self._pool_key = None
+        self.is_connected = False
+    
+    @staticmethod
+    def close_pool():
+        """
+        Drop every connection parked for reuse, e.g. at application shutdown.
+        
+        Like force_close(), the sockets are shut down without the close
+        handshakes, so a slow link cannot hold up the exit. Cached private
+        keys are dropped as well.
+        """
+        global _reaper
+        with _idle_lock:
+            stacks = list(_idle_clients.values())
+            _idle_clients.clear()
+            if _reaper is not None:
+                _reaper.cancel()
+                _reaper = None
+        with _private_keys_lock:
+            _private_keys.clear()
+        for stack in stacks:
+            for client, _, _ in stack:
+                _drop_connection(client)
+    
     def list_remote_directory(self, path: str = None) -> List[Dict[str, Any]]:
         """
         List files and directories in the remote path.
@@ -169,8 +543,11 @@ class SFTPClient:
             if path is None:
                 path = self.current_remote_path
             
+            with self._session_lock:
+                entries = self.sftp_client.listdir_attr(path)
+            
             files = []
-            for item in self.sftp_client.listdir_attr(path):
+            for item in entries:
                 file_info = {
                     'name': item.filename,
                     'size': item.st_size or 0,
@@ -204,29 +581,48 @@ class SFTPClient:
             if path is None:
                 path = self.current_local_path
             
-            files = []
-            for item in os.listdir(path):
-                full_path = os.path.join(path, item)
-                stat_info = os.stat(full_path)
+            return self.scan_local_directory(path)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to list local directory: {e}")
+            raise
+    
+    @staticmethod
+    def scan_local_directory(path: str) -> List[Dict[str, Any]]:
+        """
+        List a local directory without needing an SFTPClient instance.
+        
+        Uses a single os.scandir pass; each entry costs one stat call.
+        
+        Args:
+            path: Local directory path
+            
+        Returns:
+            List of file/directory information dictionaries, directories first
+        """
+        files = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    stat_info = entry.stat()
+                except OSError:
+                    # Broken symlink; describe the link itself
+                    stat_info = entry.stat(follow_symlinks=False)
                 
                 file_info = {
-                    'name': item,
+                    'name': entry.name,
                     'size': stat_info.st_size,
                     'modified': datetime.fromtimestamp(stat_info.st_mtime),
                     'permissions': stat.filemode(stat_info.st_mode),
-                    'is_directory': os.path.isdir(full_path),
-                    'is_file': os.path.isfile(full_path),
-                    'full_path': full_path
+                    'is_directory': stat.S_ISDIR(stat_info.st_mode),
+                    'is_file': stat.S_ISREG(stat_info.st_mode),
+                    'full_path': entry.path
                 }
                 files.append(file_info)
-            
-            # Sort: directories first, then files, both alphabetically
-            files.sort(key=lambda x: (not x['is_directory'], x['name'].lower()))
-            return files
-            
-        except Exception as e:
-            self.logger.error(f"Failed to list local directory: {e}")
-            raise
+        
+        # Sort: directories first, then files, both alphabetically
+        files.sort(key=lambda x: (not x['is_directory'], x['name'].lower()))
+        return files
     
     def change_remote_directory(self, path: str) -> bool:
         """
@@ -242,23 +638,15 @@ class SFTPClient:
             raise ConnectionError("Not connected to server")
         
         try:
-            # Handle relative paths
-            if path == "..":
-                # Go to parent directory
-                current_parts = self.current_remote_path.rstrip('/').split('/')
-                if len(current_parts) > 1:
-                    new_path = '/'.join(current_parts[:-1]) or '/'
-                else:
-                    new_path = '/'
-            elif path.startswith('/'):
-                # Absolute path
-                new_path = path
-            else:
-                # Relative path
-                new_path = f"{self.current_remote_path.rstrip('/')}/{path}"
+            # Resolve relative paths, "..", "." and doubled slashes in one step
+            new_path = posixpath.normpath(posixpath.join(self.current_remote_path, path))
             
-            # Test if directory exists by listing it
-            self.sftp_client.listdir(new_path)
+            # One stat round trip, however large the directory is
+            with self._session_lock:
+                mode = self.sftp_client.stat(new_path).st_mode or 0
+            if not stat.S_ISDIR(mode):
+                self.logger.error(f"Failed to change remote directory: {new_path} is not a directory")
+                return False
             self.current_remote_path = new_path
             return True
             
@@ -325,7 +713,8 @@ class SFTPClient:
                 elif self.progress_callback:
                     self.progress_callback(transferred, total)
             
-            self.sftp_client.put(local_path, remote_path, callback=progress_wrapper)
+            with self._session_lock:
+                self.sftp_client.put(local_path, remote_path, callback=progress_wrapper)
             self.logger.info(f"Uploaded {local_path} to {remote_path}")
             return True
             
@@ -361,7 +750,8 @@ class SFTPClient:
                 elif self.progress_callback:
                     self.progress_callback(transferred, total)
             
-            self.sftp_client.get(remote_path, local_path, callback=progress_wrapper)
+            with self._session_lock:
+                self.sftp_client.get(remote_path, local_path, callback=progress_wrapper)
             self.logger.info(f"Downloaded {remote_path} to {local_path}")
             return True
             
@@ -369,6 +759,323 @@ class SFTPClient:
             self.logger.error(f"Download failed: {e}")
             return False
     
+    def transfer_files(self, pairs: List[Tuple[str, str]], upload: bool,
+                       file_callback=None, sizes: Optional[List[int]] = None) -> List[bool]:
+        """
+        Transfer several files concurrently over the current connection.
+        
+        Each worker thread opens its own SFTP channel on the shared SSH
+        transport, so small files no longer wait on each other's round
+        trips. Progress is reported as the combined byte count of the batch,
+        against a total summed up before the first file starts.
+        
+        Args:
+            pairs: (source_path, destination_path) tuples
+            upload: True to upload local files, False to download remote ones
+            file_callback: Optional callback(index, success) run as each file
+                finishes, on the thread that transferred it
+            sizes: Source file sizes, if the caller already knows them;
+                otherwise they are looked up first
+            
+        Returns:
+            List[bool]: Success flag for each pair, in order
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to server")
+        
+        if len(pairs) < 2:
+            transfer = self.upload_file if upload else self.download_file
+            results = []
+            for index, (source, destination) in enumerate(pairs):
+                results.append(transfer(source, destination))
+                if file_callback:
+                    file_callback(index, results[-1])
+            return results
+        
+        lock = threading.Lock()
+        reported = [0] * len(pairs)
+        expected_sizes = list(sizes) if sizes is not None else self._source_sizes(pairs, upload)
+        totals = [0, sum(expected_sizes)]  # bytes transferred, bytes expected
+        
+        def report(index, transferred, total):
+            # Reported under the lock, so the callback never sees totals go back
+            with lock:
+                totals[0] += transferred - reported[index]
+                reported[index] = transferred
+                # A file that changed size since it was looked up corrects the total
+                totals[1] += total - expected_sizes[index]
+                expected_sizes[index] = total
+                if self.progress_callback:
+                    self.progress_callback(*totals)
+        
+        # paramiko SFTP channels must not be shared between threads
+        worker = threading.local()
+        channels = []
+        
+        def transfer_one(index, source, destination):
+            try:
+                sftp = getattr(worker, "sftp", None)
+                if sftp is None:
+                    sftp = worker.sftp = self.open_channel()
+                    with lock:
+                        channels.append(sftp)
+                
+                callback = lambda transferred, total: report(index, transferred, total)
+                if upload:
+                    sftp.put(source, destination, callback=callback)
+                else:
+                    local_dir = os.path.dirname(destination)
+                    if local_dir:
+                        os.makedirs(local_dir, exist_ok=True)
+                    sftp.get(source, destination, callback=callback)
+                
+                self.logger.info(f"{'Uploaded' if upload else 'Downloaded'} {source} to {destination}")
+                return True
+            except Exception as e:
+                self.logger.error(f"{'Upload' if upload else 'Download'} failed: {e}")
+                return False
+        
+        def run(index, source, destination):
+            success = transfer_one(index, source, destination)
+            if file_callback:
+                file_callback(index, success)
+            return success
+        
+        workers = self._reserve_channels(min(self.max_parallel_transfers, len(pairs)))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                sources, destinations = zip(*pairs)
+                return list(pool.map(run, range(len(pairs)), sources, destinations))
+        finally:
+            for sftp in channels:
+                sftp.close()
+            self._release_channels(workers)
+    
+    def _source_sizes(self, pairs: List[Tuple[str, str]], upload: bool) -> List[int]:
+        """Look up the size of each pair's source file, 0 where it cannot be read."""
+        sizes = []
+        for source, _ in pairs:
+            try:
+                if upload:
+                    sizes.append(os.path.getsize(source))
+                else:
+                    with self._session_lock:
+                        sizes.append(self.sftp_client.stat(source).st_size or 0)
+            except (OSError, IOError):
+                sizes.append(0)
+        return sizes
+    
+    def _reserve_channels(self, wanted: int) -> int:
+        """
+        Reserve up to wanted extra channels, waiting only for the first.
+        
+        The rest are taken only if free, so two batches running at once
+        never each hold some slots while waiting for the other's.
+        
+        Args:
+            wanted: Channels the caller could use
+            
+        Returns:
+            int: Channels reserved, at least 1; hand it to _release_channels()
+        """
+        self._channel_slots.acquire()
+        reserved = 1
+        while reserved < wanted and self._channel_slots.acquire(blocking=False):
+            reserved += 1
+        return reserved
+    
+    def _release_channels(self, count: int):
+        """Free channels reserved by _reserve_channels()."""
+        for _ in range(count):
+            self._channel_slots.release()
+    
+    def open_channel(self) -> 'paramiko.SFTPClient':
+        """
+        Open an extra SFTP session on the current SSH connection.
+        
+        The session shares the connection's TCP socket and keys, so it
+        costs one channel-open round trip rather than a new handshake.
+        Callers must close it, and open it under a slot reserved with
+        _reserve_channels(), so the connection stays within max_channels
+        sessions (including the main one).
+        
+        Returns:
+            paramiko.SFTPClient: New SFTP session
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to server")
+        
+        return self.ssh_client.open_sftp()
+    
+    def bulk_upload(self, local_paths: List[str], remote_dir: str, file_callback=None) -> bool:
+        """
+        Upload many local files as one tar stream over an exec channel.
+        
+        Every file sent over SFTP costs several request round trips; for
+        many small files a single 'tar x' on the server is far faster.
+        Servers that only allow SFTP, or lack tar, make this return False,
+        and callers should then fall back to transfer_files().
+        
+        Local owners and permissions are left out of the archive, so the
+        files end up owned by the remote user with the server's default
+        mode, as an SFTP upload would leave them.
+        
+        Args:
+            local_paths: Local files, each stored in remote_dir under its own name
+            remote_dir: Existing remote directory to extract into
+            file_callback: Optional callback(index, success) run for every
+                file once the server has extracted the archive; not called
+                when this returns False
+            
+        Returns:
+            bool: True if the server extracted the archive successfully
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to server")
+        
+        try:
+            total = sum(os.path.getsize(path) for path in local_paths)
+            sent = [0]
+            
+            def count(length):
+                sent[0] += length
+                if self.progress_callback:
+                    self.progress_callback(sent[0], total)
+            
+            # The exec session counts against the server's limit too
+            self._reserve_channels(1)
+            try:
+                channel = self.ssh_client.get_transport().open_session()
+            except BaseException:
+                self._release_channels(1)
+                raise
+            try:
+                channel.exec_command(f"tar xf - -C {shlex.quote(remote_dir)}")
+                # Closing the stdin file sends EOF, which ends the remote tar
+                with channel.makefile_stdin("wb") as stream:
+                    # Symlinks are followed, sending their contents as an SFTP upload would
+                    with tarfile.open(fileobj=stream, mode="w|", dereference=True) as archive:
+                        for path in local_paths:
+                            info = _neutral_tarinfo(archive.gettarinfo(path, os.path.basename(path)))
+                            with open(path, "rb") as f:
+                                archive.addfile(info, _CountingReader(f, count))
+                status = channel.recv_exit_status()
+            finally:
+                channel.close()
+                self._release_channels(1)
+            
+            if status != 0:
+                self.logger.warning(f"Bulk upload to {remote_dir} exited with status {status}")
+                return False
+            
+            self.logger.info(f"Uploaded {len(local_paths)} files to {remote_dir} as one archive")
+            if file_callback:
+                for index in range(len(local_paths)):
+                    file_callback(index, True)
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"Bulk upload failed: {e}")
+            return False
+    
+    def upload_directory(self, local_dir: str, remote_dir: str) -> bool:
+        """
+        Upload a local directory tree, sending its files concurrently.
+        
+        Remote directories are created first, parents before children.
+        The files then go through transfer_files() largest first, so one
+        big file does not start last and hold up the whole batch.
+        
+        Args:
+            local_dir: Local directory to upload
+            remote_dir: Remote path the directory is copied to
+            
+        Returns:
+            bool: True if every directory and file was transferred
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to server")
+        
+        try:
+            files = []
+            for root, _, filenames in os.walk(local_dir):
+                relative = os.path.relpath(root, local_dir)
+                target = remote_dir if relative == "." else posixpath.join(remote_dir, *relative.split(os.sep))
+                self._ensure_remote_directory(target)
+                for filename in filenames:
+                    path = os.path.join(root, filename)
+                    files.append((os.path.getsize(path), path, posixpath.join(target, filename)))
+        except Exception as e:
+            self.logger.error(f"Directory upload failed: {e}")
+            return False
+        
+        files.sort(key=lambda entry: entry[0], reverse=True)
+        results = self.transfer_files([(source, target) for _, source, target in files], upload=True,
+                                      sizes=[size for size, _, _ in files])
+        self.logger.info(f"Uploaded {sum(results)}/{len(results)} files from {local_dir} to {remote_dir}")
+        return all(results)
+    
+    def download_directory(self, remote_dir: str, local_dir: str) -> bool:
+        """
+        Download a remote directory tree, fetching its files concurrently.
+        
+        The tree is listed first and local directories created as they are
+        found; the files then go through transfer_files() largest first.
+        
+        Args:
+            remote_dir: Remote directory to download
+            local_dir: Local path the directory is copied to
+            
+        Returns:
+            bool: True if every directory and file was transferred
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to server")
+        
+        try:
+            files = []
+            pending = [(remote_dir, local_dir)]
+            while pending:
+                source, target = pending.pop()
+                os.makedirs(target, exist_ok=True)
+                with self._session_lock:
+                    entries = self.sftp_client.listdir_attr(source)
+                for entry in entries:
+                    name = entry.filename
+                    # Never let a server-supplied name escape the target directory
+                    if name in ('.', '..') or os.path.basename(name) != name:
+                        continue
+                    
+                    remote_path = posixpath.join(source, name)
+                    local_path = os.path.join(target, name)
+                    # Servers may leave out the mode and size attributes
+                    mode = entry.st_mode or 0
+                    if stat.S_ISDIR(mode):
+                        pending.append((remote_path, local_path))
+                    elif stat.S_ISREG(mode):
+                        files.append((entry.st_size or 0, remote_path, local_path))
+        except Exception as e:
+            self.logger.error(f"Directory download failed: {e}")
+            return False
+        
+        files.sort(key=lambda entry: entry[0], reverse=True)
+        results = self.transfer_files([(source, target) for _, source, target in files], upload=False,
+                                      sizes=[size for size, _, _ in files])
+        self.logger.info(f"Downloaded {sum(results)}/{len(results)} files from {remote_dir} to {local_dir}")
+        return all(results)
+    
+    def _ensure_remote_directory(self, remote_path: str):
+        """Create a remote directory unless it already exists."""
+        with self._session_lock:
+            try:
+                self.sftp_client.mkdir(remote_path)
+            except IOError:
+                # An existing directory is fine; anything else is re-raised. Both
+                # backends report SFTP failures, such as mkdir on an existing
+                # path, as IOError
+                if not stat.S_ISDIR(self.sftp_client.stat(remote_path).st_mode or 0):
+                    raise
+    
     def delete_remote_file(self, remote_path: str) -> bool:
         """
         Delete a file on the remote server.
@@ -383,7 +1090,8 @@ class SFTPClient:
             raise ConnectionError("Not connected to server")
         
         try:
-            self.sftp_client.remove(remote_path)
+            with self._session_lock:
+                self.sftp_client.remove(remote_path)
             self.logger.info(f"Deleted remote file: {remote_path}")
             return True
             
@@ -391,6 +1099,55 @@ class SFTPClient:
             self.logger.error(f"Failed to delete remote file: {e}")
             return False
     
+    def delete_remote_files(self, remote_paths: List[str]) -> List[bool]:
+        """
+        Delete several remote files concurrently.
+        
+        The removes are spread over worker threads with their own SFTP
+        channels, as in transfer_files(), so several deletes share each
+        round trip instead of waiting on one another.
+        
+        Args:
+            remote_paths: Remote file paths
+            
+        Returns:
+            List[bool]: Success flag for each path, in order
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to server")
+        
+        if len(remote_paths) < 2:
+            return [self.delete_remote_file(remote_path) for remote_path in remote_paths]
+        
+        # paramiko SFTP channels must not be shared between threads
+        lock = threading.Lock()
+        worker = threading.local()
+        channels = []
+        
+        def remove(remote_path):
+            try:
+                sftp = getattr(worker, "sftp", None)
+                if sftp is None:
+                    sftp = worker.sftp = self.open_channel()
+                    with lock:
+                        channels.append(sftp)
+                
+                sftp.remove(remote_path)
+                self.logger.info(f"Deleted remote file: {remote_path}")
+                return True
+            except Exception as e:
+                self.logger.error(f"Failed to delete remote file: {e}")
+                return False
+        
+        workers = self._reserve_channels(min(self.max_parallel_transfers, len(remote_paths)))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(remove, remote_paths))
+        finally:
+            for sftp in channels:
+                sftp.close()
+            self._release_channels(workers)
+    
     def create_remote_directory(self, remote_path: str) -> bool:
         """
         Create a directory on the remote server.
@@ -405,7 +1162,8 @@ class SFTPClient:
             raise ConnectionError("Not connected to server")
         
         try:
-            self.sftp_client.mkdir(remote_path)
+            with self._session_lock:
+                self.sftp_client.mkdir(remote_path)
             self.logger.info(f"Created remote directory: {remote_path}")
             return True
             
@@ -427,7 +1185,8 @@ class SFTPClient:
             raise ConnectionError("Not connected to server")
         
         try:
-            self.sftp_client.rmdir(remote_path)
+            with self._session_lock:
+                self.sftp_client.rmdir(remote_path)
             self.logger.info(f"Deleted remote directory: {remote_path}")
             return True
             
@@ -449,7 +1208,8 @@ class SFTPClient:
             raise ConnectionError("Not connected to server")
         
         try:
-            stat_info = self.sftp_client.stat(remote_path)
+            with self._session_lock:
+                stat_info = self.sftp_client.stat(remote_path)
             return {
                 'size': stat_info.st_size,
                 'modified': datetime.fromtimestamp(stat_info.st_mtime) if stat_info.st_mtime else None,
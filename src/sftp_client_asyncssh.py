@@ -0,0 +1,463 @@
+"""
+asyncssh SFTP Backend
+Optional SFTPClient variant that runs its transfers on asyncssh.
+"""
+
+import asyncio
+import errno
+import importlib.util
+import logging
+import os
+import threading
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+from sftp_client import SFTPClient
+
+# asyncssh is optional and only used when the connection.backend setting asks
+# for it. Only its presence is checked here, the import itself waits for connect()
+_HAVE_ASYNCSSH = importlib.util.find_spec("asyncssh") is not None
+
+# SFTP status codes with an errno equivalent, mapped as paramiko maps them
+_SFTP_ERRNO = {2: errno.ENOENT, 3: errno.EACCES}
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared asyncssh event loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="asyncssh-loop", daemon=True
+            ).start()
+    return _loop
+
+
+def _run(coro, timeout: Optional[float] = None):
+    """Run a coroutine on the asyncssh loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop()).result(timeout)
+
+
+def _run_sftp(coro):
+    """Run an SFTP request, raising failures as IOError like paramiko does."""
+    import asyncssh
+
+    try:
+        return _run(coro)
+    except asyncssh.SFTPError as e:
+        code = _SFTP_ERRNO.get(e.code)
+        if code is None:
+            raise IOError(e.reason) from e
+        raise IOError(code, e.reason) from e
+
+
+def _attributes(filename: str, attrs) -> SimpleNamespace:
+    """Present asyncssh file attributes with paramiko's SFTPAttributes names."""
+    return SimpleNamespace(
+        filename=filename,
+        st_size=attrs.size,
+        st_mtime=attrs.mtime,
+        st_mode=attrs.permissions,
+    )
+
+
+def _progress_handler(callback):
+    """Adapt a paramiko-style callback(transferred, total) to asyncssh."""
+    if callback is None:
+        return None
+    return lambda source, destination, transferred, total: callback(transferred, total)
+
+
+def create_sftp_client(backend: str = "paramiko") -> SFTPClient:
+    """
+    Create the SFTP client for the configured backend.
+
+    Args:
+        backend: "paramiko", or "asyncssh" for pipelined transfers
+
+    Returns:
+        SFTPClient: AsyncSSHClient when asyncssh was asked for and is
+        installed, else the paramiko SFTPClient
+    """
+    if backend == "asyncssh":
+        if _HAVE_ASYNCSSH:
+            return AsyncSSHClient()
+        logging.getLogger(__name__).warning("asyncssh is not installed, using paramiko")
+    return SFTPClient()
+
+
+class _BlockingSFTP:
+    """Blocking wrapper giving an asyncssh SFTP session paramiko's method names and errors."""
+
+    def __init__(self, sftp):
+        self.sftp = sftp
+
+    def getcwd(self) -> str:
+        return _run_sftp(self.sftp.getcwd())
+
+    def listdir(self, path: str) -> List[str]:
+        return [
+            name
+            for name in _run_sftp(self.sftp.listdir(path))
+            if name not in (".", "..")
+        ]
+
+    def listdir_attr(self, path: str) -> List[SimpleNamespace]:
+        return [
+            _attributes(entry.filename, entry.attrs)
+            for entry in _run_sftp(self.sftp.readdir(path))
+            if entry.filename not in (".", "..")
+        ]
+
+    def stat(self, path: str) -> SimpleNamespace:
+        return _attributes(os.path.basename(path), _run_sftp(self.sftp.stat(path)))
+
+    def put(self, localpath: str, remotepath: str, callback=None):
+        _run_sftp(
+            self.sftp.put(
+                localpath, remotepath, progress_handler=_progress_handler(callback)
+            )
+        )
+
+    def get(self, remotepath: str, localpath: str, callback=None):
+        _run_sftp(
+            self.sftp.get(
+                remotepath, localpath, progress_handler=_progress_handler(callback)
+            )
+        )
+
+    def remove(self, path: str):
+        _run_sftp(self.sftp.remove(path))
+
+    def mkdir(self, path: str):
+        _run_sftp(self.sftp.mkdir(path))
+
+    def rmdir(self, path: str):
+        _run_sftp(self.sftp.rmdir(path))
+
+    def close(self):
+        _event_loop().call_soon_threadsafe(self.sftp.exit)
+
+
+class AsyncSSHClient(SFTPClient):
+    """
+    SFTPClient running on asyncssh instead of paramiko.
+
+    asyncssh keeps many SFTP read/write requests in flight on a single
+    channel, so batches share one session instead of one channel per
+    worker thread. The public API is unchanged: every method blocks and
+    returns the same values as SFTPClient, while the protocol work runs
+    on one event loop in a background thread.
+
+    The paramiko-only tuning (socket_buffer_size, preferred_ciphers) and
+    the idle connection pool do not apply here, and bulk_upload() always
+    declines. The app uses this class only when the connection.backend
+    setting is "asyncssh".
+    """
+
+    def __init__(self):
+        """Initialize the asyncssh client."""
+        super().__init__()
+        self._connection = None
+        # Future of a connect() still in progress, so force_close() can cancel it
+        self._connecting = None
+
+    def connect(
+        self,
+        host: str,
+        username: str,
+        password: str = None,
+        private_key_path: str = None,
+        port: int = 22,
+    ) -> bool:
+        """
+        Connect to an SFTP server.
+
+        Args:
+            host: Server hostname or IP address
+            username: Username for authentication
+            password: Password for authentication (optional if using key)
+            private_key_path: Path to private key file (optional)
+            port: Server port (default: 22)
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        import asyncssh
+
+        try:
+            self.host = host
+            self.port = port
+            self.username = username
+
+            # Host keys are accepted as with paramiko's AutoAddPolicy; compression
+            # only costs CPU on the already-compressed data most transfers carry
+            options = {
+                "port": port,
+                "username": username,
+                "known_hosts": None,
+                "connect_timeout": self.timeout,
+                "compression_algs": None,
+            }
+            if self.channel_window_size:
+                options["window"] = self.channel_window_size
+            if self.keepalive_interval:
+                options["keepalive_interval"] = self.keepalive_interval
+
+            if private_key_path and os.path.exists(private_key_path):
+                options["client_keys"] = [private_key_path]
+                if password:
+                    options["passphrase"] = password
+                    options["password"] = password
+            elif password:
+                options["password"] = password
+            else:
+                self.logger.error("No authentication method provided")
+                return False
+
+            self._connecting = asyncio.run_coroutine_threadsafe(
+                asyncssh.connect(host, **options), _event_loop()
+            )
+            self._connection = self._connecting.result()
+            self.sftp_client = _BlockingSFTP(_run(self._connection.start_sftp_client()))
+            self.is_connected = True
+
+            # Get initial remote directory
+            self.current_remote_path = self.sftp_client.getcwd() or "/"
+
+            self.logger.info(f"Connected to {host}:{port} as {username} (asyncssh)")
+            if self.status_callback:
+                self.status_callback(f"Connected to {host}")
+
+            return True
+
+        except asyncssh.PermissionDenied:
+            self.logger.error("Authentication failed")
+            if self.status_callback:
+                self.status_callback("Authentication failed")
+            return False
+        except asyncssh.Error as e:
+            self.logger.error(f"SSH connection error: {e}")
+            if self.status_callback:
+                self.status_callback(f"Connection error: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Connection failed: {e}")
+            if self.status_callback:
+                self.status_callback(f"Connection failed: {e}")
+            return False
+        finally:
+            self._connecting = None
+
+    def disconnect(self, keep_alive: bool = False):
+        """
+        Disconnect from the SFTP server.
+
+        Args:
+            keep_alive: Accepted for compatibility; asyncssh connections are
+                always closed
+        """
+        try:
+            if self.sftp_client:
+                self.sftp_client.close()
+                self.sftp_client = None
+
+            if self._connection:
+                connection = self._connection
+                self._connection = None
+
+                async def close():
+                    connection.close()
+                    await connection.wait_closed()
+
+                _run(close(), timeout=self.timeout)
+
+            self.is_connected = False
+            self.logger.info("Disconnected from server")
+            if self.status_callback:
+                self.status_callback("Disconnected")
+
+        except Exception as e:
+            self.logger.error(f"Error during disconnect: {e}")
+
+    def force_close(self):
+        """
+        Drop the connection at once, skipping the SFTP and SSH close handshakes.
+
+        A connect() still in progress on another thread is cancelled too.
+        """
+        if self._connecting:
+            self._connecting.cancel()
+        if self._connection:
+            _event_loop().call_soon_threadsafe(self._connection.abort)
+            self._connection = None
+
+        self.sftp_client = None
+        self.is_connected = False
+
+    def open_channel(self) -> _BlockingSFTP:
+        """
+        Open an extra SFTP session on the current connection.
+
+        Returns:
+            _BlockingSFTP: New SFTP session; callers must close it
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to server")
+
+        return _BlockingSFTP(_run(self._connection.start_sftp_client()))
+
+    def transfer_files(
+        self,
+        pairs: List[Tuple[str, str]],
+        upload: bool,
+        file_callback=None,
+        sizes: Optional[List[int]] = None,
+    ) -> List[bool]:
+        """
+        Transfer several files concurrently over the current SFTP session.
+
+        Up to max_parallel_transfers files are in flight at once, all as
+        pipelined requests on the one session. Progress is reported as the
+        combined byte count of the batch, against a total summed up before
+        the first file starts.
+
+        Args:
+            pairs: (source_path, destination_path) tuples
+            upload: True to upload local files, False to download remote ones
+            file_callback: Optional callback(index, success) run as each file
+                finishes, on the asyncssh event loop thread
+            sizes: Source file sizes, if the caller already knows them;
+                otherwise they are looked up first
+
+        Returns:
+            List[bool]: Success flag for each pair, in order
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to server")
+
+        return _run(self._transfer_all(pairs, upload, file_callback, sizes))
+
+    async def _transfer_all(
+        self,
+        pairs: List[Tuple[str, str]],
+        upload: bool,
+        file_callback,
+        sizes: Optional[List[int]],
+    ) -> List[bool]:
+        """Coroutine behind transfer_files(); runs on the event loop thread."""
+        sftp = self.sftp_client.sftp
+        slots = asyncio.Semaphore(max(1, self.max_parallel_transfers))
+        reported = [0] * len(pairs)
+
+        if sizes is not None:
+            expected_sizes = list(sizes)
+        elif upload:
+            expected_sizes = self._source_sizes(pairs, upload)
+        else:
+            # All the stats go out at once rather than one round trip each
+            found = await asyncio.gather(
+                *(sftp.stat(source) for source, _ in pairs), return_exceptions=True
+            )
+            expected_sizes = [
+                0 if isinstance(attrs, Exception) else attrs.size or 0
+                for attrs in found
+            ]
+        totals = [0, sum(expected_sizes)]  # bytes transferred, bytes expected
+
+        def report(index, transferred, total):
+            totals[0] += transferred - reported[index]
+            reported[index] = transferred
+            # A file that changed size since it was looked up corrects the total
+            totals[1] += total - expected_sizes[index]
+            expected_sizes[index] = total
+            if self.progress_callback:
+                self.progress_callback(*totals)
+
+        async def transfer_one(index, source, destination):
+            handler = lambda src, dst, transferred, total: report(
+                index, transferred, total
+            )
+            try:
+                async with slots:
+                    if upload:
+                        await sftp.put(source, destination, progress_handler=handler)
+                    else:
+                        local_dir = os.path.dirname(destination)
+                        if local_dir:
+                            os.makedirs(local_dir, exist_ok=True)
+                        await sftp.get(source, destination, progress_handler=handler)
+
+                self.logger.info(
+                    f"{'Uploaded' if upload else 'Downloaded'} {source} to {destination}"
+                )
+                success = True
+            except Exception as e:
+                self.logger.error(f"{'Upload' if upload else 'Download'} failed: {e}")
+                success = False
+
+            if file_callback:
+                file_callback(index, success)
+            return success
+
+        return list(
+            await asyncio.gather(
+                *(
+                    transfer_one(index, source, destination)
+                    for index, (source, destination) in enumerate(pairs)
+                )
+            )
+        )
+
+    def delete_remote_files(self, remote_paths: List[str]) -> List[bool]:
+        """
+        Delete several remote files concurrently over the current SFTP session.
+
+        Args:
+            remote_paths: Remote file paths
+
+        Returns:
+            List[bool]: Success flag for each path, in order
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to server")
+
+        return _run(self._delete_all(remote_paths))
+
+    async def _delete_all(self, remote_paths: List[str]) -> List[bool]:
+        """Coroutine behind delete_remote_files(); runs on the event loop thread."""
+        sftp = self.sftp_client.sftp
+
+        async def remove(remote_path):
+            try:
+                await sftp.remove(remote_path)
+                self.logger.info(f"Deleted remote file: {remote_path}")
+                return True
+            except Exception as e:
+                self.logger.error(f"Failed to delete remote file: {e}")
+                return False
+
+        return list(
+            await asyncio.gather(*(remove(remote_path) for remote_path in remote_paths))
+        )
+
+    def bulk_upload(
+        self, local_paths: List[str], remote_dir: str, file_callback=None
+    ) -> bool:
+        """
+        Decline tar uploads; pipelined SFTP already covers many small files.
+
+        Args:
+            local_paths: Local files to upload
+            remote_dir: Remote directory to upload into
+            file_callback: Unused, as nothing is uploaded
+
+        Returns:
+            bool: Always False, so callers fall back to transfer_files()
+        """
+        return False
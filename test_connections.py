@@ -6,20 +6,31 @@ This script tests all configured SFTP connections to verify they work.
 """
 
 import sys
-import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from config_manager import ConfigManager
+from _bootstrap import ConfigManager
 from sftp_client import SFTPClient
 
+_print_lock = threading.Lock()
+
 def test_connection(name, connection_data):
-    """Test a single SFTP connection."""
-    print(f"\n🔗 Testing: {name}")
-    print(f"   Host: {connection_data['host']}:{connection_data['port']}")
-    print(f"   User: {connection_data['username']}")
+    """Test a single SFTP connection, printing its report as one block."""
+    report = [
+        f"\n🔗 Testing: {name}",
+        f"   Host: {connection_data['host']}:{connection_data['port']}",
+        f"   User: {connection_data['username']}"
+    ]
+    
+    success = _check_connection(connection_data, report)
     
+    # Tests run concurrently; keep each report together
+    with _print_lock:
+        print("\n".join(report))
+    return success
+
+def _check_connection(connection_data, report):
+    """Connect and list the root directory, appending results to report."""
     client = SFTPClient()
     try:
         # Attempt connection
@@ -32,39 +43,40 @@ def test_connection(name, connection_data):
         )
         
         if success:
-            print(f"   ✅ Connection successful!")
+            report.append(f"   ✅ Connection successful!")
             
             # Try to list directory
             try:
                 files = client.list_remote_directory("/")
-                print(f"   📁 Found {len(files)} items in root directory")
+                report.append(f"   📁 Found {len(files)} items in root directory")
                 
                 # Show first few items
                 for i, file_info in enumerate(files[:3]):
                     file_type = "📁" if file_info["is_directory"] else "📄"
-                    print(f"      {file_type} {file_info['name']}")
+                    report.append(f"      {file_type} {file_info['name']}")
                 
                 if len(files) > 3:
-                    print(f"      ... and {len(files) - 3} more items")
+                    report.append(f"      ... and {len(files) - 3} more items")
                     
             except Exception as e:
-                print(f"   ⚠️  Connected but couldn't list directory: {e}")
+                report.append(f"   ⚠️  Connected but couldn't list directory: {e}")
             
             # Disconnect
             client.disconnect()
             return True
             
         else:
-            print(f"   ❌ Connection failed")
+            report.append(f"   ❌ Connection failed")
             return False
             
     except Exception as e:
-        print(f"   ❌ Connection error: {e}")
+        report.append(f"   ❌ Connection error: {e}")
         return False
 
-def test_all_connections():
+def test_all_connections(config=None):
     """Test all configured connections."""
-    config = ConfigManager()
+    if config is None:
+        config = ConfigManager()
     connection_names = list(config.load_connections().keys())
     
     if not connection_names:
@@ -77,18 +89,27 @@ def test_all_connections():
     successful = 0
     failed = 0
     
+    # Use get_connection to get decrypted passwords
+    connections = {}
     for name in connection_names:
-        # Use get_connection to get decrypted passwords
         connection_data = config.get_connection(name)
         if connection_data:
-            if test_connection(name, connection_data):
-                successful += 1
-            else:
-                failed += 1
+            connections[name] = connection_data
         else:
             print(f"❌ Could not load connection: {name}")
             failed += 1
     
+    # Handshakes mostly wait on the network, so test the servers side by side
+    if connections:
+        with ThreadPoolExecutor(max_workers=min(16, len(connections))) as executor:
+            futures = [executor.submit(test_connection, name, connection_data)
+                       for name, connection_data in connections.items()]
+            for future in as_completed(futures):
+                if future.result():
+                    successful += 1
+                else:
+                    failed += 1
+    
     print("\n" + "=" * 60)
     print(f"📊 Test Results:")
     print(f"   ✅ Successful: {successful}")